@@ -1,9 +1,12 @@
 from __future__ import annotations
 
 import logging
+import sys
+from bisect import bisect_right
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Iterable, List, Mapping
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Iterable, List, Mapping, Sequence, Tuple
 
 from prophecycm.characters.player import AbilityScore, Class, Feat, PlayerCharacter, Race, Skill
 from prophecycm.core import Serializable
@@ -11,14 +14,42 @@ from prophecycm.core_ids import DEFAULT_ID_REGISTRY, ensure_typed_id
 from prophecycm.items import Equipment, Item
 from prophecycm.rules import SKILL_IDS, SKILL_TO_ABILITY
 
+if TYPE_CHECKING:  # pragma: no cover - runtime import would be circular
+    from prophecycm.state.leveling import LevelUpRequest
+
 LOGGER = logging.getLogger(__name__)
 
+_LEVEL_UP_REQUEST: type[LevelUpRequest] | None = None
+
+
+def _level_up_request_type() -> type[LevelUpRequest]:
+    """Resolve LevelUpRequest on first use; prophecycm.state imports this package."""
+
+    global _LEVEL_UP_REQUEST
+    if _LEVEL_UP_REQUEST is None:
+        from prophecycm.state.leveling import LevelUpRequest
+
+        _LEVEL_UP_REQUEST = LevelUpRequest
+    return _LEVEL_UP_REQUEST
+
 
 class AbilityGenerationMethod(str, Enum):
     POINT_BUY = "point_buy"
     STANDARD_ARRAY = "standard_array"
 
 
+_ABILITY_METHOD_MAP: Mapping[object, AbilityGenerationMethod] = AbilityGenerationMethod._value2member_map_
+
+
+def _coerce_ability_method(raw: object) -> AbilityGenerationMethod:
+    try:
+        return _ABILITY_METHOD_MAP[raw]
+    except (KeyError, TypeError) as exc:
+        raise ValueError(f"{raw!r} is not a valid {AbilityGenerationMethod.__name__}") from exc
+
+
+_PC_PREFIX = "pc"
+
 _DEFAULT_POINT_BUY_COSTS: Dict[int, int] = {
     8: 0,
     9: 1,
@@ -31,12 +62,12 @@ _DEFAULT_POINT_BUY_COSTS: Dict[int, int] = {
 }
 
 
-@dataclass
+@dataclass(slots=True)
 class GearBundle(Serializable):
     id: str
     label: str
     description: str = ""
-    item_ids: List[str] = field(default_factory=list)
+    item_ids: Tuple[str, ...] = ()
 
     def resolve_items(self, catalog_items: Mapping[str, Item]) -> List[Item]:
         resolved: List[Item] = []
@@ -46,12 +77,23 @@ class GearBundle(Serializable):
             resolved.append(catalog_items[item_id])
         return resolved
 
-@dataclass
+    @classmethod
+    def from_dict(cls, data: Dict[str, object]) -> "GearBundle":
+        get = data.get
+        return cls(
+            id=get("id", ""),
+            label=get("label", ""),
+            description=get("description", ""),
+            item_ids=tuple(get("item_ids", ())),
+        )
+
+
+@dataclass(slots=True)
 class Background(Serializable):
     id: str
     name: str
-    starting_skills: List[str] = field(default_factory=list)
-    starting_item_ids: List[str] = field(default_factory=list)
+    starting_skills: Tuple[str, ...] = ()
+    starting_item_ids: Tuple[str, ...] = ()
 
     def resolve_items(self, catalog_items: Mapping[str, Item]) -> List[Item]:
         resolved: List[Item] = []
@@ -65,17 +107,67 @@ class Background(Serializable):
     def from_dict(cls, data: Dict[str, object]) -> "Background":
         if isinstance(data, str):
             return cls(id=data, name=data)
-        starting_skills = data.get("starting_skills") or data.get("background_starting_skills", [])
-        starting_items = data.get("starting_item_ids") or data.get("background_starting_items", [])
+        get = data.get
+        starting_skills = get("starting_skills") or get("background_starting_skills", [])
+        starting_items = get("starting_item_ids") or get("background_starting_items", [])
         return cls(
-            id=data.get("id", data.get("name", "")),
-            name=data.get("name", data.get("id", "")),
-            starting_skills=list(starting_skills),
-            starting_item_ids=list(starting_items),
+            id=get("id", get("name", "")),
+            name=get("name", get("id", "")),
+            starting_skills=tuple(starting_skills),
+            starting_item_ids=tuple(starting_items),
         )
 
 
-@dataclass
+def _interned(names: Iterable[str]) -> List[str]:
+    """Intern name strings so dict and set probes on them can short-circuit on identity."""
+
+    return [sys.intern(name) if type(name) is str else name for name in names]
+
+
+@lru_cache(maxsize=64)
+def _unknown_active_skills(active_skills: tuple[str, ...]) -> tuple[str, ...]:
+    return tuple(sorted(set(active_skills) - set(SKILL_TO_ABILITY)))
+
+
+@lru_cache(maxsize=64)
+def _omitted_registry_skills(active_skills: tuple[str, ...]) -> tuple[str, ...]:
+    active = set(active_skills)
+    return tuple(skill for skill in SKILL_IDS if skill not in active)
+
+
+@lru_cache(maxsize=64)
+def _skill_catalog_entries(active_skills: tuple[str, ...]) -> tuple[tuple[str, str], ...]:
+    return tuple((skill, sys.intern(SKILL_TO_ABILITY[skill])) for skill in active_skills)
+
+
+@lru_cache(maxsize=256)
+def _unknown_class_skills(
+    class_skill_list: tuple[str, ...], skill_catalog: tuple[str, ...]
+) -> tuple[str, ...]:
+    catalog = set(skill_catalog)
+    return tuple(sorted(skill for skill in class_skill_list if skill not in catalog))
+
+
+def _coerce_point_buy_costs(raw: Mapping[object, object] | None) -> Dict[int, int]:
+    # Always hand back a private dict: configs own (and may edit) their cost table, and a shared
+    # read-only proxy would break Serializable.to_dict, which deep-copies field values.
+    if raw is None or raw is _DEFAULT_POINT_BUY_COSTS:
+        return dict(_DEFAULT_POINT_BUY_COSTS)
+    if all(type(k) is int and type(v) is int for k, v in raw.items()):
+        return dict(raw)
+    return {int(k): int(v) for k, v in raw.items()}
+
+
+_CATALOG_ENTRY_FIELDS = (
+    ("races", Race),
+    ("classes", Class),
+    ("backgrounds", Background),
+    ("feats", Feat),
+    ("gear_bundles", GearBundle),
+)
+
+
+@dataclass(slots=True)
 class CharacterCreationConfig(Serializable):
     races: List[Race] = field(default_factory=list)
     classes: List[Class] = field(default_factory=list)
@@ -83,38 +175,39 @@ class CharacterCreationConfig(Serializable):
     feats: List[Feat] = field(default_factory=list)
     gear_bundles: List[GearBundle] = field(default_factory=list)
     ability_names: List[str] | None = field(default_factory=list)
-    standard_array: List[int] | None = field(default_factory=list)
+    standard_array: Tuple[int, ...] | None = ()
     point_buy_total: int = 27
     point_buy_costs: Dict[int, int] = field(default_factory=lambda: dict(_DEFAULT_POINT_BUY_COSTS))
-    active_skills: List[str] = field(default_factory=list)
+    active_skills: Tuple[str, ...] = ()
     skill_catalog: Dict[str, str] = field(default_factory=lambda: dict(SKILL_TO_ABILITY))
     skill_choices: int = 0
     feat_choices: int = 0
-    bonus_feat_levels: List[int] = field(default_factory=list)
-    bonus_ability_increase_levels: List[int] = field(default_factory=list)
+    bonus_feat_levels: Tuple[int, ...] = ()
+    bonus_ability_increase_levels: Tuple[int, ...] = ()
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "CharacterCreationConfig":
-        raw_skill_catalog = data.get("skills", data.get("skill_catalog", {}))
-        active_skills = data.get("active_skills") or list(raw_skill_catalog) or []
+        get = data.get
+        raw_skill_catalog = get("skills", get("skill_catalog", {}))
+        active_skills = get("active_skills") or list(raw_skill_catalog) or []
+        entries = {
+            attr: [entry_cls.from_dict(entry) for entry in get(attr, ())]
+            for attr, entry_cls in _CATALOG_ENTRY_FIELDS
+        }
         return cls(
-            races=[Race.from_dict(entry) for entry in data.get("races", [])],
-            classes=[Class.from_dict(entry) for entry in data.get("classes", [])],
-            backgrounds=[Background.from_dict(entry) for entry in data.get("backgrounds", [])],
-            feats=[Feat.from_dict(entry) for entry in data.get("feats", [])],
-            gear_bundles=[GearBundle.from_dict(entry) for entry in data.get("gear_bundles", [])],
-            ability_names=list(data.get("ability_names", [])) or None,
-            standard_array=list(data.get("standard_array", [])) or None,
-            point_buy_total=int(data.get("point_buy_total", 27)),
-            point_buy_costs={int(k): int(v) for k, v in data.get("point_buy_costs", _DEFAULT_POINT_BUY_COSTS).items()},
-            active_skills=list(active_skills),
+            **entries,
+            ability_names=list(get("ability_names", [])) or None,
+            standard_array=tuple(get("standard_array", ())) or None,
+            point_buy_total=int(get("point_buy_total", 27)),
+            point_buy_costs=_coerce_point_buy_costs(get("point_buy_costs")),
+            active_skills=tuple(active_skills),
             skill_catalog={str(k): str(v) for k, v in raw_skill_catalog.items()},
-            skill_choices=int(data.get("skill_choices", 0)),
-            feat_choices=int(data.get("feat_choices", 0)),
-            bonus_feat_levels=[int(level) for level in data.get("bonus_feat_levels", [])],
-            bonus_ability_increase_levels=[
-                int(level) for level in data.get("bonus_ability_increase_levels", [])
-            ],
+            skill_choices=int(get("skill_choices", 0)),
+            feat_choices=int(get("feat_choices", 0)),
+            bonus_feat_levels=tuple(int(level) for level in get("bonus_feat_levels", ())),
+            bonus_ability_increase_levels=tuple(
+                int(level) for level in get("bonus_ability_increase_levels", ())
+            ),
         )
 
     def __post_init__(self) -> None:
@@ -127,41 +220,54 @@ class CharacterCreationConfig(Serializable):
                 "wisdom",
                 "charisma",
             ]
+        else:
+            self.ability_names = _interned(self.ability_names)
         if not self.standard_array:
-            self.standard_array = [15, 14, 13, 12, 10, 8]
+            self.standard_array = (15, 14, 13, 12, 10, 8)
+        else:
+            self.standard_array = tuple(self.standard_array)
+        self.bonus_feat_levels = tuple(self.bonus_feat_levels)
+        self.bonus_ability_increase_levels = tuple(self.bonus_ability_increase_levels)
 
         if not self.active_skills:
-            self.active_skills = list(self.skill_catalog) or list(SKILL_TO_ABILITY)
+            self.active_skills = tuple(self.skill_catalog) or tuple(SKILL_TO_ABILITY)
+        active_skills = self.active_skills = tuple(_interned(self.active_skills))
 
-        unknown_skills = sorted(set(self.active_skills) - set(SKILL_TO_ABILITY))
+        unknown_skills = _unknown_active_skills(active_skills)
         if unknown_skills:
             raise ValueError(
                 "Unknown skills provided in campaign configuration: "
                 + ", ".join(unknown_skills)
             )
 
-        omitted_registry_skills = [skill for skill in SKILL_IDS if skill not in self.active_skills]
+        omitted_registry_skills = _omitted_registry_skills(active_skills)
         if omitted_registry_skills:
             LOGGER.info(
                 "Canonical skills omitted by campaign whitelist: %s",
                 ", ".join(omitted_registry_skills),
             )
 
-        self.skill_catalog = {skill: SKILL_TO_ABILITY[skill] for skill in self.active_skills}
+        self.skill_catalog = dict(_skill_catalog_entries(active_skills))
+        catalog_skills = tuple(self.skill_catalog)
 
         for character_class in self.classes:
             if not character_class.class_skill_list:
-                character_class.class_skill_list = list(self.skill_catalog)
-            unknown_class_skills = [
-                skill for skill in character_class.class_skill_list if skill not in self.skill_catalog
-            ]
+                character_class.class_skill_list = catalog_skills
+            else:
+                character_class.class_skill_list = tuple(_interned(character_class.class_skill_list))
+            unknown_class_skills = _unknown_class_skills(character_class.class_skill_list, catalog_skills)
             if unknown_class_skills:
                 raise ValueError(
-                    f"Class '{character_class.id}' has unknown skills: {', '.join(sorted(unknown_class_skills))}"
+                    f"Class '{character_class.id}' has unknown skills: {', '.join(unknown_class_skills)}"
                 )
 
+        for race in self.races:
+            race.skill_proficiencies = _interned(race.skill_proficiencies)
+        for background in self.backgrounds:
+            background.starting_skills = tuple(_interned(background.starting_skills))
 
-@dataclass
+
+@dataclass(slots=True)
 class CharacterCreationSelection(Serializable):
     name: str
     background_id: str
@@ -176,24 +282,40 @@ class CharacterCreationSelection(Serializable):
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "CharacterCreationSelection":
+        get = data.get
         return cls(
-            name=data.get("name", ""),
-            background_id=data.get("background_id") or data.get("background", ""),
-            race_id=data.get("race_id", ""),
-            class_id=data.get("class_id", ""),
-            ability_method=AbilityGenerationMethod(data.get("ability_method")),
-            ability_scores=dict(data.get("ability_scores", {})),
-            trained_skills=list(data.get("trained_skills", [])),
-            feat_ids=list(data.get("feat_ids", [])),
-            gear_bundle_id=data.get("gear_bundle_id"),
-            level=int(data.get("level", 1)),
+            name=get("name", ""),
+            background_id=get("background_id") or get("background", ""),
+            race_id=get("race_id", ""),
+            class_id=get("class_id", ""),
+            ability_method=_coerce_ability_method(get("ability_method")),
+            ability_scores=dict(get("ability_scores", {})),
+            trained_skills=list(get("trained_skills", ())),
+            feat_ids=list(get("feat_ids", ())),
+            gear_bundle_id=get("gear_bundle_id"),
+            level=int(get("level", 1)),
         )
 
 
-@dataclass
+@dataclass(slots=True)
+class _PreparedCharacter:
+    """A selection resolved by ``CharacterCreator`` and ready to be built."""
+
+    selection: CharacterCreationSelection
+    pc_id: str
+    race: Race
+    character_class: Class
+    background: Background
+    feats: List[Feat]
+    skills: Dict[str, Skill]
+    abilities: Dict[str, AbilityScore]
+    inventory: List[Item]
+
+
+@dataclass(slots=True)
 class CharacterCreationResult(Serializable):
     character: PlayerCharacter
-    pending_level_ups: List["LevelUpRequest"] = field(default_factory=list)
+    pending_level_ups: List[LevelUpRequest] = field(default_factory=list)
 
 
 class CharacterCreator:
@@ -205,8 +327,56 @@ class CharacterCreator:
         self._feats = {feat.id: feat for feat in config.feats}
         self._gear_bundles = {bundle.id: bundle for bundle in config.gear_bundles}
         self._backgrounds = {background.id: background for background in config.backgrounds}
+        self._skill_catalog_set = frozenset(config.skill_catalog)
+        self._skill_prototypes = tuple(config.skill_catalog.items())
+        self._expected_abilities = frozenset(config.ability_names)
+        # (standard array it was built from, that array sorted); see _sorted_standard_array_for.
+        self._standard_array_rule: tuple[Sequence[int], List[int]] | None = None
+        # class id -> (class_skill_list it was built from, (allowed skills, unknown entries))
+        self._class_skill_rules: Dict[str, tuple[Sequence[str], tuple[frozenset[str], List[str]]]] = {}
+        for char_class in config.classes:
+            self._class_skill_rules_for(char_class)
+        self._sorted_bonus_feat_levels = tuple(sorted(config.bonus_feat_levels))
+        self._class_choice_tiers: Dict[str, tuple[Dict[int, Dict[str, object]], tuple[int, ...]]] = {}
+        # (copy of the costs it was built from, lowest costed score, costs indexed from it)
+        self._point_buy_rule: tuple[Dict[int, int], int, tuple[int | None, ...]] | None = None
+        self._allowed_prefixes = DEFAULT_ID_REGISTRY.allowed_prefixes
+        self._resolved_items: Dict[tuple[str, str], tuple[Sequence[str], tuple[Item, ...]]] = {}
 
     def build_character(self, selection: CharacterCreationSelection) -> CharacterCreationResult:
+        result = self._create_character(self._prepare_character(selection))
+        self._register_character(result)
+        return result
+
+    def build_characters(
+        self, selections: Sequence[CharacterCreationSelection]
+    ) -> List[CharacterCreationResult]:
+        """Build a batch of characters, validating every selection before any is created.
+
+        Ids are registered only after every character in the batch has been built, so a bad
+        selection (including a feat whose prerequisites fail) leaves no ids behind.
+        """
+
+        prepared: List[_PreparedCharacter] = []
+        for index, selection in enumerate(selections):
+            try:
+                prepared.append(self._prepare_character(selection))
+            except ValueError as exc:
+                raise ValueError(f"Selection {index} ('{selection.name}'): {exc}") from exc
+
+        results: List[CharacterCreationResult] = []
+        for index, parts in enumerate(prepared):
+            try:
+                results.append(self._create_character(parts))
+            except ValueError as exc:
+                raise ValueError(f"Selection {index} ('{parts.selection.name}'): {exc}") from exc
+        for result in results:
+            self._register_character(result)
+        return results
+
+    def _prepare_character(self, selection: CharacterCreationSelection) -> _PreparedCharacter:
+        """Resolve and validate a selection without building or registering anything."""
+
         race = self._resolve_race(selection.race_id)
         character_class = self._resolve_class(selection.class_id)
 
@@ -216,49 +386,55 @@ class CharacterCreator:
         skills = self._select_skills(selection, background, race, character_class)
         base_abilities = self._assign_abilities(selection)
         abilities = self._apply_ability_bonuses(base_abilities, race, character_class)
-        inventory = list(self._select_background_items(background))
-        inventory.extend(self._select_gear(selection))
-
-        pc_id = DEFAULT_ID_REGISTRY.register(
-            ensure_typed_id(
-                selection.name,
-                expected_prefix="pc",
-                allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes,
-            ),
-            expected_prefix="pc",
-        )
-
-        pc = PlayerCharacter(
-            id=pc_id,
-            name=selection.name,
-            background=background.name,
-            abilities=abilities,
-            skills=skills,
+        inventory = [*self._select_background_items(background), *self._select_gear(selection)]
+        return _PreparedCharacter(
+            selection=selection,
+            pc_id=ensure_typed_id(selection.name, expected_prefix=_PC_PREFIX, allowed_prefixes=self._allowed_prefixes),
             race=race,
             character_class=character_class,
+            background=background,
             feats=feats,
-            inventory=list(inventory),
-            level=selection.level,
+            skills=skills,
+            abilities=abilities,
+            inventory=inventory,
+        )
+
+    def _create_character(self, prepared: _PreparedCharacter) -> CharacterCreationResult:
+        """Build the character for a prepared selection; its id is not registered yet."""
+
+        pc = PlayerCharacter(
+            id=prepared.pc_id,
+            name=prepared.selection.name,
+            background=prepared.background.name,
+            abilities=prepared.abilities,
+            skills=prepared.skills,
+            race=prepared.race,
+            character_class=prepared.character_class,
+            feats=prepared.feats,
+            inventory=prepared.inventory,
+            level=prepared.selection.level,
             scores_include_static_bonuses=True,
         )
 
-        for item in inventory:
-            if isinstance(item, Equipment):
-                try:
-                    pc.equip_item(item)
-                except ValueError:
-                    # If a bundle tries to equip conflicting gear, prefer inventory placement.
-                    continue
-        pending_level_ups = self._pending_class_feature_choices(pc, character_class)
+        # Gear with slot conflicts or unmet requirements stays in the inventory unequipped.
+        pc.equip_items([item for item in prepared.inventory if isinstance(item, Equipment)])
+        pending_level_ups = self._pending_class_feature_choices(pc, prepared.character_class)
         return CharacterCreationResult(character=pc, pending_level_ups=pending_level_ups)
 
+    @staticmethod
+    def _register_character(result: CharacterCreationResult) -> None:
+        DEFAULT_ID_REGISTRY.register(result.character.id, expected_prefix=_PC_PREFIX)
+
     def _assign_abilities(self, selection: CharacterCreationSelection) -> Dict[str, int]:
-        scores = {name: int(score) for name, score in selection.ability_scores.items()}
-        expected = set(self.config.ability_names)
-        missing = expected - set(scores)
+        scores = selection.ability_scores
+        if not all(type(score) is int for score in scores.values()):
+            scores = {name: int(score) for name, score in scores.items()}
+        expected = self._expected_abilities
+        assigned = scores.keys()
+        missing = expected - assigned
         if missing:
             raise ValueError(f"Missing ability assignments for: {', '.join(sorted(missing))}")
-        extra = set(scores) - expected
+        extra = assigned - expected
         if extra:
             raise ValueError(f"Unknown ability assignments provided: {', '.join(sorted(extra))}")
 
@@ -274,28 +450,58 @@ class CharacterCreator:
     def _apply_ability_bonuses(
         self, scores: Dict[str, int], race: Race, character_class: Class
     ) -> Dict[str, AbilityScore]:
+        # Bonuses are coerced to int when races and classes are loaded.
         merged = dict(scores)
+        lookup = merged.get
         for bonus_source in (race.ability_bonuses, character_class.ability_bonuses):
             for ability, bonus in bonus_source.items():
-                if ability in merged:
-                    merged[ability] = merged.get(ability, 0) + int(bonus)
+                current = lookup(ability)
+                if current is not None:
+                    merged[ability] = current + bonus
         return {name: AbilityScore(name=name, score=score) for name, score in merged.items()}
 
     def _validate_standard_array(self, scores: Mapping[str, int]) -> None:
-        provided = sorted(scores.values())
-        if provided != sorted(self.config.standard_array):
+        if sorted(scores.values()) != self._sorted_standard_array_for(self.config.standard_array):
             raise ValueError("Ability scores must match the standard array exactly")
 
+    def _sorted_standard_array_for(self, standard_array: Sequence[int]) -> List[int]:
+        """Return the configured standard array sorted, rebuilt whenever it is reassigned."""
+
+        cached = self._standard_array_rule
+        if cached is None or cached[0] is not standard_array:
+            cached = self._standard_array_rule = (standard_array, sorted(standard_array))
+        return cached[1]
+
+    def _point_buy_costs_for(self, point_buy_costs: Dict[int, int]) -> tuple[int, tuple[int | None, ...]]:
+        """Return the lowest costed score and the costs indexed from it.
+
+        The table is rebuilt whenever the configured costs differ from the ones it was built
+        from, so both reassigning and editing ``point_buy_costs`` in place take effect.
+        """
+
+        cached = self._point_buy_rule
+        if cached is None or cached[0] != point_buy_costs:
+            minimum = min(point_buy_costs, default=0)
+            table = tuple(
+                point_buy_costs.get(score) for score in range(minimum, max(point_buy_costs, default=-1) + 1)
+            )
+            cached = self._point_buy_rule = (dict(point_buy_costs), minimum, table)
+        return cached[1], cached[2]
+
     def _validate_point_buy(self, scores: Mapping[str, int]) -> None:
+        config = self.config
+        minimum, costs = self._point_buy_costs_for(config.point_buy_costs)
+        size = len(costs)
+        budget = config.point_buy_total
         total = 0
         for ability, score in scores.items():
-            if score not in self.config.point_buy_costs:
+            index = score - minimum
+            cost = costs[index] if 0 <= index < size else None
+            if cost is None:
                 raise ValueError(f"Score {score} for {ability} not allowed by point buy rules")
-            total += self.config.point_buy_costs[score]
-        if total > self.config.point_buy_total:
-            raise ValueError(
-                f"Point buy total {total} exceeds budget of {self.config.point_buy_total}"
-            )
+            total += cost
+        if total > budget:
+            raise ValueError(f"Point buy total {total} exceeds budget of {budget}")
 
     def _select_skills(
         self,
@@ -304,106 +510,160 @@ class CharacterCreator:
         race: Race,
         character_class: Class,
     ) -> Dict[str, Skill]:
-        chosen = list(selection.trained_skills)
+        chosen = selection.trained_skills
         expected_choices = character_class.skill_choice_count or self.config.skill_choices
         if expected_choices and len(chosen) != expected_choices:
             raise ValueError(
                 f"Expected {expected_choices} trained skills, got {len(chosen)}"
             )
 
-        class_skill_list = set(character_class.class_skill_list or self.config.active_skills)
-        unknown_selection = [skill for skill in chosen if skill not in self.config.skill_catalog]
-        if unknown_selection:
-            raise ValueError(f"Unknown skills selected: {', '.join(sorted(unknown_selection))}")
-
-        disallowed = [skill for skill in chosen if skill not in class_skill_list]
-        if disallowed:
-            raise ValueError(
-                f"Selected skills not allowed for class '{character_class.id}': {', '.join(sorted(disallowed))}"
-            )
+        skill_catalog = self._skill_catalog_set
+        class_skill_list, invalid_class_skills = self._class_skill_rules_for(character_class)
+        auto_trained: set[str] = set()
+        if chosen:
+            unknown_selection: List[str] = []
+            disallowed: List[str] = []
+            for skill in chosen:
+                if skill not in skill_catalog:
+                    unknown_selection.append(skill)
+                elif skill not in class_skill_list:
+                    disallowed.append(skill)
+                else:
+                    auto_trained.add(skill)
+            if unknown_selection:
+                raise ValueError(f"Unknown skills selected: {', '.join(sorted(unknown_selection))}")
+            if disallowed:
+                raise ValueError(
+                    f"Selected skills not allowed for class '{character_class.id}': {', '.join(sorted(disallowed))}"
+                )
 
-        invalid_class_skills = [
-            skill for skill in character_class.class_skill_list if skill not in SKILL_TO_ABILITY
-        ]
         if invalid_class_skills:
             raise ValueError(
                 f"Class '{character_class.id}' references unknown skills: {', '.join(sorted(invalid_class_skills))}"
             )
 
-        background_skills = list(background.starting_skills)
-        unknown_background = [skill for skill in background_skills if skill not in self.config.skill_catalog]
-        if unknown_background:
-            raise ValueError(
-                f"Background '{background.id}' has unknown skills: {', '.join(sorted(unknown_background))}"
+        for owner, skill_source in (
+            (f"Background '{background.id}'", background.starting_skills),
+            (f"Race '{race.id}'", race.skill_proficiencies),
+        ):
+            unknown: List[str] = []
+            for skill in skill_source:
+                if skill in skill_catalog:
+                    auto_trained.add(skill)
+                else:
+                    unknown.append(skill)
+            if unknown:
+                raise ValueError(f"{owner} has unknown skills: {', '.join(sorted(unknown))}")
+
+        # Skill is mutable, so instances are built per character rather than shared.
+        if not auto_trained:
+            return {
+                name: Skill(name=name, key_ability=key_ability)
+                for name, key_ability in self._skill_prototypes
+            }
+        return {
+            name: Skill(
+                name=name,
+                key_ability=key_ability,
+                proficiency="trained" if name in auto_trained else "untrained",
             )
+            for name, key_ability in self._skill_prototypes
+        }
 
-        race_skills = [skill for skill in getattr(race, "skill_proficiencies", [])]
-        unknown_race_skills = [skill for skill in race_skills if skill not in self.config.skill_catalog]
-        if unknown_race_skills:
-            raise ValueError(
-                f"Race '{race.id}' has unknown skills: {', '.join(sorted(unknown_race_skills))}"
-            )
+    def _class_skill_rules_for(self, character_class: Class) -> tuple[frozenset[str], List[str]]:
+        """Return the allowed skill set and unknown entries for a class's skill list.
 
-        auto_trained = set(chosen) | set(background_skills) | set(race_skills)
+        Entries are cached per class and rebuilt whenever ``class_skill_list`` is reassigned.
+        """
 
-        skills: Dict[str, Skill] = {}
-        for name, key_ability in self.config.skill_catalog.items():
-            proficiency = "trained" if name in auto_trained else "untrained"
-            skills[name] = Skill(name=name, key_ability=key_ability, proficiency=proficiency)
-        return skills
+        source = character_class.class_skill_list
+        cached = self._class_skill_rules.get(character_class.id)
+        if cached is None or cached[0] is not source:
+            allowed = frozenset(source or self.config.active_skills)
+            invalid = [skill for skill in source if skill not in SKILL_TO_ABILITY]
+            cached = (source, (allowed, invalid))
+            self._class_skill_rules[character_class.id] = cached
+        return cached[1]
 
     def _select_feats(self, selection: CharacterCreationSelection) -> List[Feat]:
+        feat_ids = selection.feat_ids
         expected = self._expected_feat_count(selection.level)
-        if len(selection.feat_ids) != expected:
+        if len(feat_ids) != expected:
             raise ValueError(
-                f"Expected {expected} feats for level {selection.level}, got {len(selection.feat_ids)}"
+                f"Expected {expected} feats for level {selection.level}, got {len(feat_ids)}"
             )
 
+        known_feats = self._feats
         feats: List[Feat] = []
-        for feat_id in selection.feat_ids:
-            feat = self._feats.get(feat_id)
+        for feat_id in feat_ids:
+            feat = known_feats.get(feat_id)
             if not feat:
                 raise ValueError(f"Unknown feat id '{feat_id}'")
             feats.append(feat)
         return feats
 
     def _expected_feat_count(self, level: int) -> int:
-        baseline = self.config.feat_choices
-        bonus = len([entry for entry in self.config.bonus_feat_levels if entry <= level])
-        return baseline + bonus
+        return self.config.feat_choices + bisect_right(self._sorted_bonus_feat_levels, level)
 
     def _pending_class_feature_choices(
         self, character: PlayerCharacter, character_class: Class
-    ) -> List["LevelUpRequest"]:
-        from prophecycm.state.leveling import LevelUpRequest
+    ) -> List[LevelUpRequest]:
+        level_up_request = _level_up_request_type()
+        character_id = character.id
+        tiers = self._choice_tiers_for(character_class)
+        cutoff = bisect_right(tiers, character.level)
+        return [
+            level_up_request(character_id=character_id, character_type="pc", target_level=tier)
+            for tier in tiers[:cutoff]
+        ]
 
-        pending: List[LevelUpRequest] = []
-        if character.level <= 1:
-            return pending
-
-        for tier in range(2, character.level + 1):
-            features = character_class.feature_progression.get(tier, {})
-            choice_slots = features.get("choice_slots") if isinstance(features, dict) else None
-            if choice_slots:
-                pending.append(
-                    LevelUpRequest(
-                        character_id=character.id,
-                        character_type="pc",
-                        target_level=tier,
-                    )
+    def _choice_tiers_for(self, character_class: Class) -> tuple[int, ...]:
+        """Sorted levels (2+) whose class progression grants choice slots, cached per class."""
+
+        progression = character_class.feature_progression
+        class_id = character_class.id
+        cached = self._class_choice_tiers.get(class_id)
+        if cached is None or cached[0] is not progression:
+            tiers = tuple(
+                sorted(
+                    tier
+                    for tier, features in progression.items()
+                    if isinstance(tier, int)
+                    and tier >= 2
+                    and isinstance(features, dict)
+                    and features.get("choice_slots")
                 )
-        return pending
+            )
+            cached = (progression, tiers)
+            self._class_choice_tiers[class_id] = cached
+        return cached[1]
 
-    def _select_gear(self, selection: CharacterCreationSelection) -> Iterable[Item]:
+    def _select_gear(self, selection: CharacterCreationSelection) -> tuple[Item, ...]:
         if not selection.gear_bundle_id:
-            return []
+            return ()
         bundle = self._gear_bundles.get(selection.gear_bundle_id)
         if bundle is None:
             raise ValueError(f"Unknown gear bundle '{selection.gear_bundle_id}'")
-        return bundle.resolve_items(self.catalog_items)
-
-    def _select_background_items(self, background: Background) -> Iterable[Item]:
-        return background.resolve_items(self.catalog_items)
+        return self._resolved_items_for(bundle, bundle.item_ids)
+
+    def _select_background_items(self, background: Background) -> tuple[Item, ...]:
+        return self._resolved_items_for(background, background.starting_item_ids)
+
+    def _resolved_items_for(
+        self, owner: GearBundle | Background, item_ids: Sequence[str]
+    ) -> tuple[Item, ...]:
+        """Resolve an owner's item ids against the catalog once and reuse the result.
+
+        Resolution stays lazy so unknown ids only raise for bundles or backgrounds actually
+        selected; the cache entry is rebuilt if the owner's id list is reassigned.
+        """
+
+        key = (type(owner).__name__, owner.id)
+        cached = self._resolved_items.get(key)
+        if cached is None or cached[0] is not item_ids:
+            cached = (item_ids, tuple(owner.resolve_items(self.catalog_items)))
+            self._resolved_items[key] = cached
+        return cached[1]
 
     def _resolve_race(self, race_id: str) -> Race:
         try:
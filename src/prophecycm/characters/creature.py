@@ -1,16 +1,69 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional
+import re
+import sys
+from dataclasses import dataclass, field, replace
+from functools import lru_cache
+from operator import itemgetter
+from types import MappingProxyType
+from typing import Dict, List, Optional, Tuple
 
 from prophecycm.combat.status_effects import DispelCondition, DurationType, StatusEffect
 from prophecycm.core import Serializable
 from prophecycm.core_ids import DEFAULT_ID_REGISTRY, ensure_typed_id
 from prophecycm.characters.player import AbilityScore
-
-
-@dataclass
+from prophecycm.rules.abilities import ABILITIES, CONSTITUTION, DEXTERITY, WISDOM
+
+__all__ = [
+    "Creature",
+    "CreatureAction",
+    "CreatureTierTemplate",
+    "FrozenCreatureView",
+]
+
+_tier_distance = itemgetter(0)
+
+# Position of each core ability in ``Creature._ability_mods``; missing abilities stay at 0.
+_AB_INDEX: Dict[str, int] = {sys.intern(name): index for index, name in enumerate(ABILITIES)}
+_CON = _AB_INDEX[CONSTITUTION]
+_DEX = _AB_INDEX[DEXTERITY]
+_WIS = _AB_INDEX[WISDOM]
+
+_ADJUSTMENT_NOTE_RE = re.compile(r"(less|more) difficult", re.IGNORECASE)
+
+# Defaults merged under authored creature payloads in ``Creature.from_dict``. The containers are
+# only read or copied, never stored, so one mapping is shared across loads.
+_CREATURE_DEFAULTS: Dict[str, object] = {
+    "name": "",
+    "level": 1,
+    "role": "",
+    "hit_die": 6,
+    "armor_class": 10,
+    "abilities": {},
+    "actions": (),
+    "alignment": "",
+    "traits": (),
+    "tiers": (),
+    "adjustment_notes": None,
+    "save_proficiencies": (),
+    "speed": 30,
+    "hit_points": 0,
+    "proficiency_bonus": 2,
+    "saves": {},
+    "status_effects": (),
+    "current_hit_points": None,
+    "is_alive": True,
+}
+
+_DIFFICULTY_PREFERENCES: Dict[str, Tuple[str, ...]] = {
+    "easy": ("easy", "less_difficult", "standard", "hard"),
+    "standard": ("standard", "hard", "easy", "deadly"),
+    "hard": ("hard", "deadly", "standard", "easy"),
+    "deadly": ("deadly", "hard", "standard", "easy"),
+}
+
+
+@dataclass(slots=True)
 class CreatureAction(Serializable):
     """Represents a creature combat action/attack profile."""
 
@@ -32,8 +85,18 @@ class CreatureAction(Serializable):
             tags=list(data.get("tags", [])),
         )
 
+    def clone(self) -> "CreatureAction":
+        return CreatureAction(
+            name=self.name,
+            attack_ability=self.attack_ability,
+            to_hit_bonus=self.to_hit_bonus,
+            damage_dice=self.damage_dice,
+            damage_bonus=self.damage_bonus,
+            tags=list(self.tags),
+        )
 
-@dataclass
+
+@dataclass(slots=True)
 class CreatureTierTemplate(Serializable):
     """Author-authored tier template for alternate versions of a creature."""
 
@@ -45,6 +108,9 @@ class CreatureTierTemplate(Serializable):
     hit_point_adjustment: int = 0
     armor_class_adjustment: int = 0
     notes: str = ""
+    _modifiers: Optional[Tuple[Tuple[int, int], Dict[str, int]]] = field(
+        init=False, repr=False, compare=False, default=None
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "CreatureTierTemplate":
@@ -63,15 +129,26 @@ class CreatureTierTemplate(Serializable):
         return max(1, base_level + self.level_adjustment)
 
     def as_modifiers(self) -> Dict[str, int]:
+        """Modifier mapping for this tier; shared between calls, so treat it as read-only."""
+
+        key = (self.hit_point_adjustment, self.armor_class_adjustment)
+        cached = self._modifiers
+        if cached is not None and cached[0] == key:
+            return cached[1]
         modifiers: Dict[str, int] = {}
         if self.hit_point_adjustment:
             modifiers["hit_points"] = self.hit_point_adjustment
         if self.armor_class_adjustment:
             modifiers["armor_class"] = self.armor_class_adjustment
+        self._modifiers = (key, modifiers)
         return modifiers
 
 
-@dataclass
+# Synthetic no-adjustment tier offered by ``Creature.available_tiers``; shared, do not mutate.
+_BASE_TIER = CreatureTierTemplate(name="base", difficulty="standard")
+
+
+@dataclass(slots=True)
 class Creature(Serializable):
     """Enemy/creature stat block with 5e-inspired derived stats.
 
@@ -102,64 +179,182 @@ class Creature(Serializable):
     applied_tier: Optional[str] = None
     tier_modifiers: Dict[str, int] = field(default_factory=dict, repr=False)
     _base_armor_class: int = field(init=False, repr=False, default=0)
+    _modifier_cache: Optional[Dict[str, int]] = field(init=False, repr=False, compare=False, default=None)
+    _ability_mods: List[int] = field(init=False, repr=False, compare=False, default_factory=list)
+    _dirty: bool = field(init=False, repr=False, compare=False, default=True)
+    _computed_level: int = field(init=False, repr=False, compare=False, default=0)
+    _save_proficiency_set: frozenset[str] = field(init=False, repr=False, compare=False, default=frozenset())
 
     def __post_init__(self) -> None:
         self._base_armor_class = self.armor_class
-        self.recompute_statistics()
-        if self.current_hit_points is None:
-            self.current_hit_points = self.hit_points
-        self.current_hit_points = min(self.current_hit_points, self.hit_points)
-        if self.current_hit_points <= 0:
-            self.current_hit_points = 0
-            self.is_alive = False
+        self._save_proficiency_set = frozenset(self.save_proficiencies)
+        # Saves are always derived; start from a private dict that recompute updates in place.
+        self.saves = {}
+        self._refresh_if_dirty()
 
     def recompute_statistics(self) -> None:
-        aggregated_modifiers = self._collect_modifiers()
-        for ability_name, ability_score in self.abilities.items():
-            total_score = ability_score.score + aggregated_modifiers.get(ability_name, 0)
-            ability_score.modifier = (total_score - 10) // 2
-
-        self.proficiency_bonus = 2 + (self.level - 1) // 4
-
-        con_mod = self.abilities.get("constitution", AbilityScore()).modifier
-        dex_mod = self.abilities.get("dexterity", AbilityScore()).modifier
-        wis_mod = self.abilities.get("wisdom", AbilityScore()).modifier
-
-        avg_hit_per_level = max(1, (self.hit_die // 2) + 1 + con_mod)
-        max_hit_points = avg_hit_per_level * max(1, self.level) + aggregated_modifiers.get("hit_points", 0)
-        self.hit_points = max_hit_points
-
-        self.armor_class = self._base_armor_class + aggregated_modifiers.get("armor_class", 0) + dex_mod
-
-        save_proficiencies = set(self.save_proficiencies)
-        self.saves = {
-            "fortitude": con_mod + (self.proficiency_bonus if "fortitude" in save_proficiencies else 0)
-            + aggregated_modifiers.get("fortitude", 0),
-            "reflex": dex_mod + (self.proficiency_bonus if "reflex" in save_proficiencies else 0)
-            + aggregated_modifiers.get("reflex", 0),
-            "will": wis_mod + (self.proficiency_bonus if "will" in save_proficiencies else 0)
-            + aggregated_modifiers.get("will", 0),
-        }
-
-        if self.current_hit_points is None:
-            self.current_hit_points = self.hit_points
+        """Re-derive modifiers, hit points, AC and saves from the creature's current state.
+
+        Always a full recompute, so in-place edits to abilities, hit die, save proficiencies,
+        status effects or tier modifiers are picked up.
+        """
+
+        self._modifier_cache = None
+        self._mark_dirty()
+        self._refresh_if_dirty()
+
+    def _refresh_if_dirty(self) -> None:
+        """Recompute after the creature's own mutators; a no-op while nothing has changed.
+
+        Mutators mark the block dirty; a level change alone (through ``set_level`` or direct
+        assignment) only re-derives the level-dependent statistics.
+        """
+
+        if not self._dirty:
+            if self._computed_level == self.level:
+                return
+            aggregated_modifiers = self._collect_modifiers()
+            # Only the level moved: ability modifiers are level-independent, and the derived
+            # statistics for this level come from the ``_derive_statistics`` memo.
+            ability_mods = self._ability_mods
         else:
-            self.current_hit_points = min(self.current_hit_points, self.hit_points)
-        if self.current_hit_points <= 0:
+            aggregated_modifiers = self._collect_modifiers()
+            ability_mods = [0] * len(_AB_INDEX)
+            for ability_name, ability_score in self.abilities.items():
+                total_score = ability_score.score + aggregated_modifiers.get(ability_name, 0)
+                ability_score.modifier = (total_score - 10) // 2
+                if (index := _AB_INDEX.get(ability_name)) is not None:
+                    ability_mods[index] = ability_score.modifier
+            self._ability_mods = ability_mods
+
+        con_mod = ability_mods[_CON]
+        dex_mod = ability_mods[_DEX]
+        wis_mod = ability_mods[_WIS]
+
+        modifier = aggregated_modifiers.get
+        save_proficiencies = self._save_proficiency_set
+        (
+            self.proficiency_bonus,
+            self.hit_points,
+            self.armor_class,
+            fortitude,
+            reflex,
+            will,
+        ) = _derive_statistics(
+            self.level,
+            self.hit_die,
+            self._base_armor_class,
+            con_mod,
+            dex_mod,
+            wis_mod,
+            modifier("hit_points", 0),
+            modifier("armor_class", 0),
+            modifier("fortitude", 0),
+            modifier("reflex", 0),
+            modifier("will", 0),
+            "fortitude" in save_proficiencies,
+            "reflex" in save_proficiencies,
+            "will" in save_proficiencies,
+        )
+        saves = self.saves
+        saves["fortitude"] = fortitude
+        saves["reflex"] = reflex
+        saves["will"] = will
+
+        self._clamp_current_hp()
+        self._dirty = False
+        self._computed_level = self.level
+
+    def _clamp_current_hp(self) -> None:
+        """Fill unset hit points, cap them at the maximum and mark the creature dead at zero."""
+
+        current = self.current_hit_points
+        maximum = self.hit_points
+        if current is None or current > maximum:
+            current = maximum
+        if current <= 0:
             self.current_hit_points = 0
             self.is_alive = False
+        else:
+            self.current_hit_points = current
 
     def _collect_modifiers(self) -> Dict[str, int]:
-        modifiers: Dict[str, int] = dict(self.tier_modifiers)
+        """Aggregate tier and status-effect modifiers, reusing the cached total when valid.
 
-        def merge(source: Dict[str, int]) -> None:
-            for key, value in source.items():
-                modifiers[key] = modifiers.get(key, 0) + int(value)
+        The cache is dropped by the status-effect mutators, ``apply_tier`` and the public
+        ``recompute_statistics``, which also picks up direct edits to ``status_effects`` or
+        ``tier_modifiers``.
+        """
 
+        if self._modifier_cache is not None:
+            return self._modifier_cache
+
+        modifiers: Dict[str, int] = dict(self.tier_modifiers)
         for effect in self.status_effects:
-            merge(effect.total_modifiers())
+            for key, value in effect.total_modifiers().items():
+                # One lookup when the key is already present; only new keys pay for the miss.
+                try:
+                    modifiers[key] += value
+                except KeyError:
+                    modifiers[key] = value
+        self._modifier_cache = modifiers
         return modifiers
 
+    def _invalidate_modifiers(self) -> None:
+        self._modifier_cache = None
+        self._dirty = True
+
+    def _mark_dirty(self) -> None:
+        self._save_proficiency_set = frozenset(self.save_proficiencies)
+        self._dirty = True
+
+    def set_level(self, level: int) -> None:
+        """Change the creature's level; the next recompute re-derives level-dependent statistics."""
+
+        self.level = level
+
+    def clone(self) -> "Creature":
+        """Return an independent copy of the stat block without re-running ``__post_init__``.
+
+        Mutable per-instance state (abilities, actions, status effects, saves) is copied; tier
+        templates are authored data and are shared.
+        """
+
+        clone = object.__new__(type(self))
+        clone.id = self.id
+        clone.name = self.name
+        clone.level = self.level
+        clone.role = self.role
+        clone.hit_die = self.hit_die
+        clone.armor_class = self.armor_class
+        clone.abilities = {
+            key: AbilityScore(name=score.name, score=score.score, modifier=score.modifier, base_score=score.base_score)
+            for key, score in self.abilities.items()
+        }
+        clone.actions = [action.clone() for action in self.actions]
+        clone.alignment = self.alignment
+        clone.traits = list(self.traits)
+        clone.tiers = list(self.tiers)
+        clone.save_proficiencies = list(self.save_proficiencies)
+        clone.speed = self.speed
+        clone.hit_points = self.hit_points
+        clone.proficiency_bonus = self.proficiency_bonus
+        clone.saves = dict(self.saves)
+        clone.status_effects = [
+            replace(effect, modifiers=dict(effect.modifiers)) for effect in self.status_effects
+        ]
+        clone.current_hit_points = self.current_hit_points
+        clone.is_alive = self.is_alive
+        clone.applied_tier = self.applied_tier
+        clone.tier_modifiers = dict(self.tier_modifiers)
+        clone._base_armor_class = self._base_armor_class
+        clone._modifier_cache = None
+        clone._ability_mods = list(self._ability_mods)
+        clone._dirty = self._dirty
+        clone._computed_level = self._computed_level
+        clone._save_proficiency_set = self._save_proficiency_set
+        return clone
+
     def add_status_effect(self, effect: StatusEffect) -> None:
         for existing in self.status_effects:
             if existing.id == effect.id:
@@ -167,15 +362,22 @@ class Creature(Serializable):
                 break
         else:
             self.status_effects.append(effect)
-        self.recompute_statistics()
+        self._invalidate_modifiers()
+        self._refresh_if_dirty()
 
     def tick_status_effects(self, tick_type: DurationType = DurationType.TURNS) -> None:
         self.status_effects = [effect for effect in self.status_effects if effect.tick(tick_type)]
-        self.recompute_statistics()
+        # Always re-merge: effects appended to ``status_effects`` directly, or restacked in place
+        # by ``StatusEffect.combine``, only reach the statistics here.
+        self._invalidate_modifiers()
+        self._refresh_if_dirty()
 
     def dispel_status_effects(self, dispel_type: DispelCondition = DispelCondition.ANY) -> None:
-        self.status_effects = [effect for effect in self.status_effects if not effect.can_be_dispelled(dispel_type)]
-        self.recompute_statistics()
+        self.status_effects = [
+            effect for effect in self.status_effects if not effect.can_be_dispelled(dispel_type)
+        ]
+        self._invalidate_modifiers()
+        self._refresh_if_dirty()
 
     def apply_damage(self, amount: int) -> None:
         if not self.is_alive:
@@ -190,41 +392,68 @@ class Creature(Serializable):
         self.current_hit_points = min(self.hit_points, (self.current_hit_points or 0) + max(0, amount))
 
     def available_tiers(self, extra_tiers: Optional[List[CreatureTierTemplate]] = None) -> List[CreatureTierTemplate]:
-        tiers = [CreatureTierTemplate(name="base", difficulty="standard")]
+        tiers = [_BASE_TIER]
         tiers.extend(extra_tiers or self.tiers)
         return tiers
 
     def select_tier_for_level(self, target_level: int, difficulty: str, extra_tiers: Optional[List[CreatureTierTemplate]] = None) -> CreatureTierTemplate:
         tiers = self.available_tiers(extra_tiers)
-        preferences = {
-            "easy": ["easy", "less_difficult", "standard", "hard"],
-            "standard": ["standard", "hard", "easy", "deadly"],
-            "hard": ["hard", "deadly", "standard", "easy"],
-            "deadly": ["deadly", "hard", "standard", "easy"],
-        }
-        preferred_order = preferences.get(difficulty, [difficulty, "standard", "hard", "easy"])
+        preferred_order = _DIFFICULTY_PREFERENCES.get(difficulty) or (difficulty, "standard", "hard", "easy")
 
-        def best_match(preferred: str) -> Optional[CreatureTierTemplate]:
-            matches = [tier for tier in tiers if tier.difficulty == preferred]
-            if not matches:
-                return None
-            return min(matches, key=lambda tier: abs(tier.effective_level(self.level) - target_level))
+        base_level = self.level
+        ranked: List[Tuple[int, CreatureTierTemplate]] = []
+        buckets: Dict[str, List[Tuple[int, CreatureTierTemplate]]] = {}
+        for tier in tiers:
+            entry = (abs(max(1, base_level + tier.level_adjustment) - target_level), tier)
+            ranked.append(entry)
+            buckets.setdefault(tier.difficulty, []).append(entry)
 
         for preferred in preferred_order:
-            if (tier := best_match(preferred)) is not None:
-                return tier
-        return min(tiers, key=lambda tier: abs(tier.effective_level(self.level) - target_level))
+            if matches := buckets.get(preferred):
+                return min(matches, key=_tier_distance)[1]
+        return min(ranked, key=_tier_distance)[1]
 
     def apply_tier(self, tier: CreatureTierTemplate) -> "Creature":
-        tiered = deepcopy(self)
+        if (
+            not tier.level_adjustment
+            and not tier.hit_point_adjustment
+            and not tier.armor_class_adjustment
+            and not tier.attack_adjustment
+            and not tier.damage_adjustment
+            and not self.tier_modifiers
+            and self.level >= 1
+        ):
+            # Nothing to adjust: skip the level and tier bookkeeping, but still recompute so
+            # direct edits to the source (abilities, effects, save proficiencies) are picked up.
+            untouched = self.clone()
+            untouched.applied_tier = tier.name
+            untouched.recompute_statistics()
+            untouched.current_hit_points = untouched.hit_points
+            return untouched
+
+        return self._tiered_clone(tier, max(1, self.level + tier.level_adjustment))
+
+    def _tiered_clone(
+        self, tier: CreatureTierTemplate, level: int, attack_bonus: int = 0, damage_bonus: int = 0
+    ) -> "Creature":
+        """Copy with ``tier`` applied at ``level``; extra action bonuses ride along on the same copy.
+
+        Lets scaling land the tier and its own level progression with one recompute and one
+        pass over the copied actions.
+        """
+
+        tiered = self.clone()
         tiered.applied_tier = tier.name
-        tiered.level = max(1, tiered.level + tier.level_adjustment)
-        tiered.tier_modifiers = tier.as_modifiers()
-        tiered.recompute_statistics()
-        if tier.attack_adjustment or tier.damage_adjustment:
+        tiered.set_level(level)
+        tiered.tier_modifiers = dict(tier.as_modifiers())
+        tiered._invalidate_modifiers()
+        tiered._refresh_if_dirty()
+        attack_bonus += tier.attack_adjustment
+        damage_bonus += tier.damage_adjustment
+        if attack_bonus or damage_bonus:
             for action in tiered.actions:
-                action.to_hit_bonus += tier.attack_adjustment
-                action.damage_bonus += tier.damage_adjustment
+                action.to_hit_bonus += attack_bonus
+                action.damage_bonus += damage_bonus
         tiered.current_hit_points = tiered.hit_points
         return tiered
 
@@ -234,49 +463,141 @@ class Creature(Serializable):
             ensure_typed_id(data["id"], expected_prefix="creature", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
             expected_prefix="creature",
         )
-        abilities_data = data.get("abilities", {})
+        d = {**_CREATURE_DEFAULTS, **data}
         abilities: Dict[str, AbilityScore] = {}
-        for name, value in abilities_data.items():
+        for name, value in d["abilities"].items():
+            name = sys.intern(name)
             if isinstance(value, dict):
                 abilities[name] = AbilityScore.from_dict({"name": name, **value})
             else:
                 abilities[name] = AbilityScore(name=name, score=int(value))
 
-        actions = [CreatureAction.from_dict(action) for action in data.get("actions", [])]
-
-        tier_data = data.get("tiers", [])
-        if not tier_data and (notes := data.get("adjustment_notes")):
+        tier_data = d["tiers"]
+        if not tier_data and (notes := d["adjustment_notes"]):
             tier_data = _parse_adjustment_notes(str(notes))
 
         creature = cls(
             id=creature_id,
-            name=data.get("name", ""),
-            level=int(data.get("level", 1)),
-            role=data.get("role", ""),
-            hit_die=int(data.get("hit_die", 6)),
-            armor_class=int(data.get("armor_class", 10)),
+            name=d["name"],
+            level=int(d["level"]),
+            role=d["role"],
+            hit_die=int(d["hit_die"]),
+            armor_class=int(d["armor_class"]),
             abilities=abilities,
-            actions=actions,
-            alignment=data.get("alignment", ""),
-            traits=list(data.get("traits", [])),
+            actions=[CreatureAction.from_dict(action) for action in d["actions"]],
+            alignment=d["alignment"],
+            traits=list(d["traits"]),
             tiers=[t if isinstance(t, CreatureTierTemplate) else CreatureTierTemplate.from_dict(t) for t in tier_data],
-            save_proficiencies=list(data.get("save_proficiencies", [])),
-            speed=int(data.get("speed", 30)),
-            hit_points=int(data.get("hit_points", 0)),
-            proficiency_bonus=int(data.get("proficiency_bonus", 2)),
-            saves=data.get("saves", {}),
-            status_effects=[StatusEffect.from_dict(effect) for effect in data.get("status_effects", [])],
-            current_hit_points=data.get("current_hit_points"),
-            is_alive=bool(data.get("is_alive", True)),
+            save_proficiencies=[sys.intern(save) for save in d["save_proficiencies"]],
+            speed=int(d["speed"]),
+            hit_points=int(d["hit_points"]),
+            proficiency_bonus=int(d["proficiency_bonus"]),
+            saves=d["saves"],
+            status_effects=[StatusEffect.from_dict(effect) for effect in d["status_effects"]],
+            current_hit_points=d["current_hit_points"],
+            is_alive=bool(d["is_alive"]),
         )
         return creature
 
 
+# Creature methods that change the instance they are called on.
+_CREATURE_MUTATORS = frozenset(
+    {
+        "add_status_effect",
+        "apply_damage",
+        "dispel_status_effects",
+        "heal",
+        "recompute_statistics",
+        "set_level",
+        "tick_status_effects",
+    }
+)
+
+
+class FrozenCreatureView:
+    """Read-only proxy over a shared Creature, such as a cached scaled stat block.
+
+    Attribute writes and mutating methods raise ``AttributeError``. Dict fields come back as
+    ``MappingProxyType`` and list fields as tuples, so the containers cannot be edited either;
+    the objects inside them (ability scores, actions, status effects) are still the shared
+    creature's own and must not be mutated. ``thaw`` returns a mutable copy.
+    """
+
+    __slots__ = ("_creature",)
+
+    def __init__(self, creature: Creature) -> None:
+        object.__setattr__(self, "_creature", creature)
+
+    def __getattr__(self, name: str) -> object:
+        if name in _CREATURE_MUTATORS or name.startswith("_"):
+            raise AttributeError(f"'{name}' is not available on a read-only creature view; call thaw() first")
+        value = getattr(self._creature, name)
+        if isinstance(value, dict):
+            return MappingProxyType(value)
+        if isinstance(value, list):
+            return tuple(value)
+        return value
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"cannot set '{name}' on a read-only creature view; call thaw() first")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"cannot delete '{name}' on a read-only creature view; call thaw() first")
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, FrozenCreatureView):
+            other = other._creature
+        return self._creature == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"FrozenCreatureView({self._creature!r})"
+
+    def thaw(self) -> Creature:
+        return self._creature.clone()
+
+
+@lru_cache(maxsize=4096)
+def _derive_statistics(
+    level: int,
+    hit_die: int,
+    base_armor_class: int,
+    con_mod: int,
+    dex_mod: int,
+    wis_mod: int,
+    hit_point_bonus: int,
+    armor_class_bonus: int,
+    fortitude_bonus: int,
+    reflex_bonus: int,
+    will_bonus: int,
+    fortitude_proficient: bool,
+    reflex_proficient: bool,
+    will_proficient: bool,
+) -> tuple[int, int, int, int, int, int]:
+    """Derive (proficiency, hit points, AC, fortitude, reflex, will) from a creature's net state."""
+
+    proficiency_bonus = 2 + (level - 1) // 4
+    avg_hit_per_level = max(1, (hit_die // 2) + 1 + con_mod)
+    hit_points = avg_hit_per_level * max(1, level) + hit_point_bonus
+    armor_class = base_armor_class + armor_class_bonus + dex_mod
+    return (
+        proficiency_bonus,
+        hit_points,
+        armor_class,
+        con_mod + (proficiency_bonus if fortitude_proficient else 0) + fortitude_bonus,
+        dex_mod + (proficiency_bonus if reflex_proficient else 0) + reflex_bonus,
+        wis_mod + (proficiency_bonus if will_proficient else 0) + will_bonus,
+    )
+
+
 def _parse_adjustment_notes(notes: str) -> List[Dict[str, object]]:
     tiers: List[Dict[str, object]] = []
     for line in notes.splitlines():
-        normalized = line.lower()
-        if "less difficult" in normalized:
+        match = _ADJUSTMENT_NOTE_RE.search(line)
+        if match is None:
+            continue
+        if match.group(1).lower() == "less":
             tiers.append(
                 {
                     "name": "less_difficult",
@@ -285,7 +606,7 @@ def _parse_adjustment_notes(notes: str) -> List[Dict[str, object]]:
                     "notes": line.strip(),
                 }
             )
-        elif "more difficult" in normalized:
+        else:
             tiers.append(
                 {
                     "name": "more_difficult",
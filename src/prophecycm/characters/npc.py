@@ -1,22 +1,109 @@
 from __future__ import annotations
 
-from copy import deepcopy
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, TYPE_CHECKING
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
+from enum import IntEnum
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, TYPE_CHECKING, Tuple, Union
 
 from prophecycm.combat.status_effects import StatusEffect
 from prophecycm.core import Serializable
 from prophecycm.core_ids import DEFAULT_ID_REGISTRY, ensure_typed_id
 from prophecycm.items.item import Item
-from prophecycm.characters.player import XP_THRESHOLDS
+from prophecycm.characters.creature import FrozenCreatureView
+from prophecycm.characters.player import level_for_xp
 
 if TYPE_CHECKING:
     from prophecycm.characters.creature import Creature, CreatureTierTemplate
 else:
     from prophecycm.characters.creature import Creature, CreatureTierTemplate
 
+__all__ = [
+    "DEFAULT_DIFFICULTY_MULTIPLIERS",
+    "Difficulty",
+    "NPC",
+    "NPCScalingProfile",
+]
 
-@dataclass
+
+class Difficulty(IntEnum):
+    """Built-in difficulties; an index into the default multiplier table."""
+
+    EASY = 0
+    STANDARD = 1
+    HARD = 2
+    DEADLY = 3
+
+
+# Names indexed by ``Difficulty``; these are the keys the serialized multiplier tables use.
+_DIFFICULTY_NAMES = ("easy", "standard", "hard", "deadly")
+
+
+class _ReadOnlyMultipliers(dict):
+    """Shared default multiplier table; a plain dict to serializers and copy, but not mutable."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args: object, **kwargs: object) -> None:
+        raise TypeError("default difficulty multipliers are shared; assign a new dict to customise")
+
+    __setitem__ = __delitem__ = __ior__ = _read_only  # type: ignore[assignment]
+    clear = pop = popitem = setdefault = update = _read_only  # type: ignore[assignment]
+
+    def __reduce__(self) -> str:
+        # Unpickle (e.g. from a worker process) as the module's shared table, keeping identity.
+        return "DEFAULT_DIFFICULTY_MULTIPLIERS"
+
+    def __copy__(self) -> "_ReadOnlyMultipliers":
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, object]) -> "_ReadOnlyMultipliers":
+        return self
+
+
+DEFAULT_DIFFICULTY_MULTIPLIERS: Dict[str, float] = _ReadOnlyMultipliers(
+    {"easy": 0.75, "standard": 1.0, "hard": 1.25, "deadly": 1.5}
+)
+# The shared table is read-only, so a positional copy can't go stale.
+_DEFAULT_MULTIPLIER_TABLE = tuple(DEFAULT_DIFFICULTY_MULTIPLIERS[name] for name in _DIFFICULTY_NAMES)
+
+# Defaults merged under authored payloads in ``from_dict``; the containers are only read.
+_SCALING_DEFAULTS: Dict[str, object] = {
+    "base_level": 1,
+    "min_level": 1,
+    "max_level": 20,
+    "attack_progression": 0,
+    "damage_progression": 0,
+    "difficulty_multipliers": None,
+    "tiers": (),
+}
+
+_NPC_DEFAULTS: Dict[str, object] = {
+    "stat_block": None,
+    "archetype": "",
+    "faction_id": "",
+    "disposition": "neutral",
+    "inventory": (),
+    "inventory_item_ids": (),
+    "status_effects": (),
+    "quest_hooks": (),
+    "is_companion": True,
+    "scaling": None,
+    "is_alive": True,
+    "xp": 0,
+    "auto_level": True,
+}
+
+# Scaled stat blocks kept per NPC; distinct (level, difficulty) queries in play are few.
+_SCALED_CACHE_SIZE = 8
+
+# Below this many payloads, process start-up and pickling cost more than decoding in-process.
+_PARALLEL_LOAD_THRESHOLD = 200
+
+
+@dataclass(slots=True)
 class NPCScalingProfile(Serializable):
     """Controls how an NPC's attached stat block scales to player level."""
 
@@ -25,31 +112,32 @@ class NPCScalingProfile(Serializable):
     max_level: int = 20
     attack_progression: int = 0
     damage_progression: int = 0
-    difficulty_multipliers: Dict[str, float] = field(
-        default_factory=lambda: {"easy": 0.75, "standard": 1.0, "hard": 1.25, "deadly": 1.5}
-    )
+    # Profiles without authored multipliers share one read-only default; assign a dict to customise.
+    difficulty_multipliers: Dict[str, float] = field(default_factory=lambda: DEFAULT_DIFFICULTY_MULTIPLIERS)
     tiers: List["CreatureTierTemplate"] = field(default_factory=list)
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "NPCScalingProfile":
-        return cls(
-            base_level=int(data.get("base_level", 1)),
-            min_level=int(data.get("min_level", 1)),
-            max_level=int(data.get("max_level", 20)),
-            attack_progression=int(data.get("attack_progression", 0)),
-            damage_progression=int(data.get("damage_progression", 0)),
-            difficulty_multipliers=data.get("difficulty_multipliers", None)
-            or {"easy": 0.75, "standard": 1.0, "hard": 1.25, "deadly": 1.5},
-            tiers=[
-                t
-                if isinstance(t, CreatureTierTemplate)
-                else CreatureTierTemplate.from_dict(t)
-                for t in data.get("tiers", [])
-            ],
+        d = {**_SCALING_DEFAULTS, **data}
+        # Every field is supplied here, so skip the generated __init__ and assign directly.
+        profile = object.__new__(cls)
+        profile.base_level = int(d["base_level"])
+        profile.min_level = int(d["min_level"])
+        profile.max_level = int(d["max_level"])
+        profile.attack_progression = int(d["attack_progression"])
+        profile.damage_progression = int(d["damage_progression"])
+        profile.difficulty_multipliers = (
+            {_intern(key): value for key, value in multipliers.items()}
+            if (multipliers := d["difficulty_multipliers"])
+            else DEFAULT_DIFFICULTY_MULTIPLIERS
         )
+        profile.tiers = [
+            t if isinstance(t, CreatureTierTemplate) else CreatureTierTemplate.from_dict(t) for t in d["tiers"]
+        ]
+        return profile
 
 
-@dataclass
+@dataclass(slots=True)
 class NPC(Serializable):
     id: str
     archetype: str
@@ -66,56 +154,121 @@ class NPC(Serializable):
     level: int = 0
     xp: int = 0
     auto_level: bool = True
+    _scaled_cache: Dict[tuple, tuple] = field(init=False, repr=False, compare=False, default_factory=dict)
 
     def __post_init__(self) -> None:
         if self.stat_block is not None:
             if self.level <= 0:
                 self.level = max(1, self.stat_block.level)
             else:
-                self.stat_block.level = self.level
+                self.stat_block.set_level(self.level)
             self.stat_block.recompute_statistics()
             self.is_alive = self.stat_block.is_alive
         elif self.level <= 0:
             self.level = 1
 
-    def scaled_stat_block(self, player_level: int, difficulty: str = "standard") -> Optional["Creature"]:
+    def scaled_stat_block(
+        self, player_level: int, difficulty: Union[Difficulty, str] = "standard", *, readonly: bool = False
+    ) -> Optional[Union["Creature", FrozenCreatureView]]:
         """Return a combat-ready copy of the NPC's stat block.
 
         Scaling is applied only if this NPC specifies an `NPCScalingProfile`.
         Base creatures remain authored values; this wrapper is the only layer
-        that can sync levels to the player.
+        that can sync levels to the player. ``readonly=True`` skips the copy and
+        returns a `FrozenCreatureView` of the cached block for inspection-only
+        callers such as AI scoring or UI tooltips.
         """
 
-        if self.stat_block is None:
+        prototype = self._scaled_prototype(player_level, difficulty)
+        if prototype is None:
             return None
+        if readonly:
+            return FrozenCreatureView(prototype)
+        # Hand out copies so callers can damage or re-level the result without touching the cache.
+        return prototype.clone()
 
-        scaled = deepcopy(self.stat_block)
-        if self.scaling is None:
-            scaled.recompute_statistics()
-            scaled.current_hit_points = scaled.hit_points
-            scaled.is_alive = self.is_alive and scaled.is_alive
-            return scaled
+    def _scaled_prototype(self, player_level: int, difficulty: Union[Difficulty, str]) -> Optional["Creature"]:
+        stat_block = self.stat_block
+        if stat_block is None:
+            return None
 
+        if isinstance(difficulty, Difficulty):
+            index: Optional[int] = difficulty
+            difficulty = _DIFFICULTY_NAMES[difficulty]
+        else:
+            index = None
+            difficulty = sys.intern(difficulty)
         scaling = self.scaling
-        base_level = scaling.base_level if scaling.base_level > 0 else scaled.level
+        # Player levels that round or clamp to the same target (including "no change") share one
+        # entry; an unscaled block is the same for every query.
+        if scaling is None:
+            target_level = None
+            difficulty = ""
+        else:
+            target_level = self._target_level(scaling, stat_block, player_level, difficulty, index)
+        key = (self.is_alive, target_level, difficulty)
+        cache = self._scaled_cache
+        entry = cache.get(key)
+        # Entries remember the stat block and scaling profile they were built from, so in-place
+        # edits (abilities, actions, status effects, progression) rebuild instead of going stale.
+        if entry is None or entry[0] != stat_block or entry[1] != scaling:
+            entry = (
+                stat_block.clone(),
+                _snapshot_scaling(scaling),
+                self._build_scaled_stat_block(stat_block, target_level, difficulty),
+            )
+            if key not in cache and len(cache) >= _SCALED_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = entry
+        return entry[2]
+
+    def invalidate_scaling(self) -> None:
+        """Drop every cached scaled stat block, for example to release memory."""
 
-        multiplier = scaling.difficulty_multipliers.get(difficulty, 1.0)
-        delta = player_level - base_level
-        adjusted_delta = int(delta * multiplier)
-        target_level = max(scaling.min_level, min(scaling.max_level, base_level + adjusted_delta))
+        self._scaled_cache.clear()
 
-        tier_candidates = scaling.tiers or scaled.tiers
-        selected_tier = scaled.select_tier_for_level(target_level, difficulty, tier_candidates)
-        scaled = scaled.apply_tier(selected_tier)
+    @staticmethod
+    def _target_level(
+        scaling: NPCScalingProfile,
+        stat_block: "Creature",
+        player_level: int,
+        difficulty: str,
+        index: Optional[int] = None,
+    ) -> int:
+        base_level = scaling.base_level if scaling.base_level > 0 else stat_block.level
+        multipliers = scaling.difficulty_multipliers
+        if index is not None and multipliers is DEFAULT_DIFFICULTY_MULTIPLIERS:
+            multiplier = _DEFAULT_MULTIPLIER_TABLE[index]
+        else:
+            multiplier = multipliers.get(difficulty, 1.0)
+        return _compute_target_level(player_level, base_level, scaling.min_level, scaling.max_level, multiplier)
 
-        level_delta = target_level - scaled.level
-        scaled.level = target_level
-        scaled.recompute_statistics()
+    def _build_scaled_stat_block(
+        self, stat_block: "Creature", target_level: Optional[int], difficulty: str
+    ) -> "Creature":
+        scaling = self.scaling
+        if scaling is None or target_level is None:
+            scaled = stat_block.clone()
+            scaled.recompute_statistics()
+            scaled.current_hit_points = scaled.hit_points
+            scaled.is_alive = self.is_alive and scaled.is_alive
+            return scaled
 
-        if level_delta != 0:
-            for action in scaled.actions:
-                action.to_hit_bonus += level_delta * scaling.attack_progression
-                action.damage_bonus += level_delta * scaling.damage_progression
+        # Both paths return a fresh clone, so the authored stat block is never mutated.
+        tier_candidates = scaling.tiers or stat_block.tiers
+        selected_tier = stat_block.select_tier_for_level(target_level, difficulty, tier_candidates)
+        level_delta = target_level - max(1, stat_block.level + selected_tier.level_adjustment)
+        if level_delta:
+            # Fold the level progression into the tier copy instead of re-levelling it afterwards.
+            scaled = stat_block._tiered_clone(
+                selected_tier,
+                target_level,
+                level_delta * scaling.attack_progression,
+                level_delta * scaling.damage_progression,
+            )
+        else:
+            # apply_tier recomputes its clone, so the tiered block is already at the target level.
+            scaled = stat_block.apply_tier(selected_tier)
 
         scaled.current_hit_points = scaled.hit_points if self.is_alive else 0
         scaled.is_alive = self.is_alive and scaled.is_alive
@@ -124,11 +277,11 @@ class NPC(Serializable):
     def recompute_statistics(self) -> None:
         if self.stat_block is None:
             return
-        self.stat_block.level = max(self.level, 1)
+        self.stat_block.set_level(max(self.level, 1))
         self.stat_block.recompute_statistics()
         self.is_alive = self.stat_block.is_alive
 
-    def apply_auto_level(self, *, difficulty: str = "standard") -> None:
+    def apply_auto_level(self, *, difficulty: Union[Difficulty, str] = "standard") -> None:
         """Bring the companion's stat block up to its tracked level."""
 
         if self.stat_block is None:
@@ -139,20 +292,17 @@ class NPC(Serializable):
             if scaled:
                 self.stat_block = scaled
         else:
-            self.stat_block.level = self.level
+            self.stat_block.set_level(self.level)
             self.stat_block.recompute_statistics()
         self.is_alive = self.stat_block.is_alive
 
     def gain_xp(self, amount: int) -> List[int]:
         self.xp += max(0, amount)
-        leveled_up: List[int] = []
-        while True:
-            next_level = self.level + 1
-            threshold = XP_THRESHOLDS.get(next_level)
-            if threshold is None or self.xp < threshold:
-                break
-            self.level = next_level
-            leveled_up.append(self.level)
+        new_level = level_for_xp(self.xp)
+        if new_level <= self.level:
+            return []
+        leveled_up = list(range(self.level + 1, new_level + 1))
+        self.level = new_level
         return leveled_up
 
     def apply_damage(self, amount: int) -> None:
@@ -166,33 +316,126 @@ class NPC(Serializable):
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "NPC":
-        stat_block_data = data.get("stat_block")
+        d = {**_NPC_DEFAULTS, **data}
+        return cls._from_payload(
+            d,
+            [Item.from_dict(item) for item in d["inventory"]],
+            [StatusEffect.from_dict(effect) for effect in d["status_effects"]],
+        )
+
+    @classmethod
+    def from_dict_many(cls, payloads: Iterable[Dict[str, object]]) -> List["NPC"]:
+        """Load several NPCs, decoding all inventories and status effects in two flat passes."""
+
+        merged = [{**_NPC_DEFAULTS, **data} for data in payloads]
+        items = list(map(Item.from_dict, [item for d in merged for item in d["inventory"]]))
+        effects = list(map(StatusEffect.from_dict, [effect for d in merged for effect in d["status_effects"]]))
+
+        npcs: List[NPC] = []
+        item_offset = effect_offset = 0
+        for d in merged:
+            item_end = item_offset + len(d["inventory"])
+            effect_end = effect_offset + len(d["status_effects"])
+            npcs.append(cls._from_payload(d, items[item_offset:item_end], effects[effect_offset:effect_end]))
+            item_offset, effect_offset = item_end, effect_end
+        return npcs
+
+    @classmethod
+    def from_dict_parallel(
+        cls, payloads: Sequence[Dict[str, object]], workers: Optional[int] = None
+    ) -> List["NPC"]:
+        """Load a large batch of NPCs across worker processes, preserving order.
+
+        Small batches (or ``workers=1``) fall back to ``from_dict_many``. Ids registered while
+        decoding in the workers are replayed into ``DEFAULT_ID_REGISTRY`` here.
+        """
+
+        payloads = list(payloads)
+        if len(payloads) <= _PARALLEL_LOAD_THRESHOLD or workers == 1:
+            return cls.from_dict_many(payloads)
+
+        workers = workers or os.cpu_count() or 1
+        # A few chunks per worker keeps them busy without paying pickle overhead per NPC.
+        chunk_size = -(-len(payloads) // (workers * 4))
+        chunks = [payloads[start : start + chunk_size] for start in range(0, len(payloads), chunk_size)]
+        npcs: List[NPC] = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunk_npcs, registered in executor.map(_load_npc_chunk, chunks):
+                for typed, prefix in registered.items():
+                    DEFAULT_ID_REGISTRY.register(typed, expected_prefix=prefix)
+                npcs.extend(chunk_npcs)
+        return npcs
+
+    @classmethod
+    def _from_payload(
+        cls, d: Dict[str, object], inventory: List[Item], status_effects: List[StatusEffect]
+    ) -> "NPC":
+        stat_block_data = d["stat_block"]
         stat_block = None if stat_block_data is None else _load_creature(stat_block_data)
         default_level = stat_block.level if stat_block is not None else 1
         npc_id = DEFAULT_ID_REGISTRY.register(
-            ensure_typed_id(data["id"], expected_prefix="npc", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
+            ensure_typed_id(d["id"], expected_prefix="npc", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
             expected_prefix="npc",
         )
-        return cls(
-            id=npc_id,
-            archetype=data.get("archetype", ""),
-            faction_id=data.get("faction_id", ""),
-            disposition=data.get("disposition", "neutral"),
-            inventory=[Item.from_dict(item) for item in data.get("inventory", [])],
-            inventory_item_ids=list(data.get("inventory_item_ids", [])),
-            status_effects=[StatusEffect.from_dict(effect) for effect in data.get("status_effects", [])],
-            quest_hooks=list(data.get("quest_hooks", [])),
-            is_companion=bool(data.get("is_companion", True)),
-            stat_block=stat_block,
-            scaling=(None if (scaling := data.get("scaling")) is None else NPCScalingProfile.from_dict(scaling)),
-            is_alive=bool(data.get("is_alive", True)),
-            level=int(data.get("level", default_level)),
-            xp=int(data.get("xp", 0)),
-            auto_level=bool(data.get("auto_level", True)),
-        )
+        # Assign fields directly instead of going through the generated __init__ and its default
+        # factories; __post_init__ still runs to sync the stat block level and liveness.
+        npc = object.__new__(cls)
+        npc.id = _intern(npc_id)
+        npc.archetype = _intern(d["archetype"])
+        npc.faction_id = _intern(d["faction_id"])
+        npc.disposition = _intern(d["disposition"])
+        npc.inventory = inventory
+        npc.inventory_item_ids = list(d["inventory_item_ids"])
+        npc.status_effects = status_effects
+        npc.quest_hooks = list(d["quest_hooks"])
+        npc.is_companion = bool(d["is_companion"])
+        npc.stat_block = stat_block
+        npc.scaling = None if (scaling := d["scaling"]) is None else NPCScalingProfile.from_dict(scaling)
+        npc.is_alive = bool(d["is_alive"])
+        npc.level = int(d.get("level", default_level))
+        npc.xp = int(d["xp"])
+        npc.auto_level = bool(d["auto_level"])
+        npc._scaled_cache = {}
+        npc.__post_init__()
+        return npc
+
+
+@lru_cache(maxsize=64)
+def _compute_target_level(player_level: int, base_level: int, min_level: int, max_level: int, multiplier: float) -> int:
+    """Clamp a difficulty-weighted move from ``base_level`` towards ``player_level``; pure, so memoised."""
+
+    target = base_level + int((player_level - base_level) * multiplier)
+    if target < min_level:
+        return min_level
+    # Matches max(min_level, min(max_level, target)) even when max_level < min_level.
+    return max(max_level, min_level) if target > max_level else target
+
 
+def _load_npc_chunk(payloads: List[Dict[str, object]]) -> Tuple[List[NPC], Dict[str, str]]:
+    """Worker entry point for ``NPC.from_dict_parallel``; also returns the ids it registered."""
+
+    known = set(DEFAULT_ID_REGISTRY.registered)
+    npcs = NPC.from_dict_many(payloads)
+    registered = {typed: prefix for typed, prefix in DEFAULT_ID_REGISTRY.registered.items() if typed not in known}
+    return npcs, registered
+
+
+def _intern(value: object) -> object:
+    """Intern low-cardinality strings shared across many NPCs; other values pass through."""
+
+    return sys.intern(value) if type(value) is str else value
+
+
+def _snapshot_scaling(scaling: Optional[NPCScalingProfile]) -> Optional[NPCScalingProfile]:
+    if scaling is None:
+        return None
+    multipliers = scaling.difficulty_multipliers
+    return replace(
+        scaling,
+        difficulty_multipliers=multipliers if multipliers is DEFAULT_DIFFICULTY_MULTIPLIERS else dict(multipliers),
+        tiers=list(scaling.tiers),
+    )
 
-def _load_creature(payload: Dict[str, object]):
-    from prophecycm.characters.creature import Creature
 
+def _load_creature(payload: Dict[str, object]) -> "Creature":
     return Creature.from_dict(payload)
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List
+from typing import DefaultDict, Dict, Iterable, Iterator, List, Tuple
 
 from prophecycm.combat.status_effects import DispelCondition, DurationType, StatusEffect
 from prophecycm.core import Serializable
@@ -18,6 +21,102 @@ class FeatStackingRule(Enum):
     STACKABLE = "stackable"
 
 
+def _merge_int_dicts(out: DefaultDict[str, int], source: Dict[str, object]) -> None:
+    """Add ``source``'s values, coerced to ``int``, into the ``out`` accumulator."""
+
+    for key, value in source.items():
+        out[key] += int(value)
+
+
+_ABILITY_NAMES = frozenset(ABILITIES)
+_UNTRAINED = "untrained"
+
+# Legacy save names resolve to the ability that governs them.
+_LEGACY_SAVE_TO_ABILITY: Dict[str, str] = {
+    "fortitude": "constitution",
+    "reflex": "dexterity",
+    "will": "wisdom",
+}
+
+# (save, governing ability) for every entry in ``PlayerCharacter.saves``, in serialized order.
+_SAVE_ABILITIES: Tuple[Tuple[str, str], ...] = (
+    *((ability, ability) for ability in ABILITIES),
+    *_LEGACY_SAVE_TO_ABILITY.items(),
+)
+
+
+def _save_proficiency_abilities(saves: Iterable[object]) -> Iterator[str]:
+    """Resolve authored save names, legacy ones included, to the abilities they cover."""
+
+    for save in saves:
+        save_key = str(save).lower()
+        ability_key = _LEGACY_SAVE_TO_ABILITY.get(save_key, save_key)
+        if ability_key in _ABILITY_NAMES:
+            yield ability_key
+
+
+def _class_save_proficiencies(character_class: "Class") -> frozenset[str]:
+    """Save proficiencies granted by ``character_class``: its rules defaults plus its own list.
+
+    The result is cached on the class and rebuilt when its name, id or list changes.
+    """
+
+    name = str(getattr(character_class, "name", ""))
+    class_id = str(getattr(character_class, "id", ""))
+    saves = tuple(getattr(character_class, "save_proficiencies", ()))
+    cached = character_class._save_prof_cache
+    if cached is not None and cached[0] == (name, class_id, saves):
+        return cached[1]
+
+    proficiencies: set[str] = set()
+
+    def add_class_defaults(key: str) -> None:
+        if key:
+            proficiencies.update(CLASS_SAVE_PROFICIENCIES.get(key, []))
+
+    add_class_defaults(name.lower())
+
+    lowered_id = class_id.lower()
+    if lowered_id.startswith("class-"):
+        add_class_defaults(lowered_id.removeprefix("class-"))
+    elif lowered_id.startswith("class."):
+        add_class_defaults(lowered_id.split(".", 1)[1])
+
+    proficiencies.update(_save_proficiency_abilities(saves))
+    result = frozenset(proficiencies)
+    character_class._save_prof_cache = ((name, class_id, saves), result)
+    return result
+
+
+def _progression_upto(source: "Race | Class", name: str, level: int) -> List[object]:
+    """Payloads of ``source.<name>`` unlocked at ``level``, in authored order.
+
+    Keys that are not integers are skipped. The unlocked keys for each level are memoised per
+    table and dropped when the table is reassigned or gains, loses or re-adds a key (checked by
+    its size and last key); payloads are always read from the live table.
+    """
+
+    progression = getattr(source, name)
+    if not progression:
+        return []
+    last_key = next(reversed(progression))
+    index = source._progression_index.get(name)
+    if index is None or index[0] is not progression or index[1] != len(progression) or index[2] != last_key:
+        key_levels = []
+        for key in progression:
+            try:
+                key_levels.append((int(key), key))
+            except (TypeError, ValueError):
+                continue
+        index = (progression, len(progression), last_key, key_levels, {})
+        source._progression_index[name] = index
+
+    unlocked = index[4].get(level)
+    if unlocked is None:
+        unlocked = index[4][level] = tuple(key for key_level, key in index[3] if key_level <= level)
+    return [progression[key] for key in unlocked]
+
+
 def _safe_slot_conversion(raw_slot: object) -> EquipmentSlot | None:
     try:
         return raw_slot if isinstance(raw_slot, EquipmentSlot) else EquipmentSlot(str(raw_slot))
@@ -25,7 +124,23 @@ def _safe_slot_conversion(raw_slot: object) -> EquipmentSlot | None:
         return None
 
 
-@dataclass
+def _derive_vitals(
+    level: int,
+    hit_die: int,
+    con_mod: int,
+    dex_mod: int,
+    hit_point_bonus: int,
+    armor_class_bonus: int,
+) -> Tuple[int, int, int]:
+    """Derive (proficiency, hit points, AC) for a player character from its net state."""
+
+    proficiency_bonus = 2 + (level - 1) // 4
+    hit_points = level * max(1, hit_die + con_mod) + hit_point_bonus
+    armor_class = 10 + dex_mod + armor_class_bonus
+    return proficiency_bonus, hit_points, armor_class
+
+
+@dataclass(slots=True)
 class AbilityScore(Serializable):
     name: str = ""
     score: int = 10
@@ -34,32 +149,32 @@ class AbilityScore(Serializable):
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "AbilityScore":
+        g = data.get
         return cls(
-            name=data.get("name", ""),
-            score=int(data.get("score", 10)),
-            modifier=int(data.get("modifier", 0)),
-            base_score=(
-                int(data["base_score"]) if data.get("base_score") is not None else None
-            ),
+            name=g("name", ""),
+            score=int(g("score", 10)),
+            modifier=int(g("modifier", 0)),
+            base_score=int(base_score) if (base_score := g("base_score")) is not None else None,
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Skill(Serializable):
     name: str
     key_ability: str
-    proficiency: str = "untrained"
+    proficiency: str = _UNTRAINED
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Skill":
+        g = data.get
         return cls(
-            name=data.get("name", ""),
-            key_ability=data.get("key_ability", ""),
-            proficiency=data.get("proficiency", "untrained"),
+            name=g("name", ""),
+            key_ability=g("key_ability", ""),
+            proficiency=g("proficiency", _UNTRAINED),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Race(Serializable):
     id: str = ""
     name: str = ""
@@ -72,29 +187,32 @@ class Race(Serializable):
     feature_progression: Dict[int, Dict[str, object]] = field(default_factory=dict)
     spell_progression: Dict[int, Dict[str, int]] = field(default_factory=dict)
     choice_slots: Dict[str, int] = field(default_factory=dict)
+    # Per-table unlock index for _progression_upto, rebuilt when a table's keys change.
+    _progression_index: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Race":
+        g = data.get
         race_id = DEFAULT_ID_REGISTRY.register(
-            ensure_typed_id(data.get("id", "race.unknown"), expected_prefix="race", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
+            ensure_typed_id(g("id", "race.unknown"), expected_prefix="race", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
             expected_prefix="race",
         )
         return cls(
             id=race_id,
-            name=data.get("name", ""),
-            subrace_id=data.get("subrace_id"),
-            ability_bonuses=data.get("ability_bonuses", {}),
-            bonuses=data.get("bonuses", {}),
-            traits=list(data.get("traits", [])),
-            skill_proficiencies=list(data.get("skill_proficiencies", [])),
-            proficiency_packs=data.get("proficiency_packs", {}),
-            feature_progression=data.get("feature_progression", {}),
-            spell_progression=data.get("spell_progression", {}),
-            choice_slots=data.get("choice_slots", {}),
+            name=g("name", ""),
+            subrace_id=g("subrace_id"),
+            ability_bonuses={k: int(v) for k, v in g("ability_bonuses", {}).items()},
+            bonuses=g("bonuses", {}),
+            traits=list(g("traits", [])),
+            skill_proficiencies=list(g("skill_proficiencies", [])),
+            proficiency_packs=g("proficiency_packs", {}),
+            feature_progression=g("feature_progression", {}),
+            spell_progression=g("spell_progression", {}),
+            choice_slots=g("choice_slots", {}),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Class(Serializable):
     id: str = ""
     name: str = ""
@@ -108,36 +226,41 @@ class Class(Serializable):
     spell_progression: Dict[int, Dict[str, int]] = field(default_factory=dict)
     choice_slots: Dict[str, int] = field(default_factory=dict)
     skill_choice_count: int = 0
-    class_skill_list: List[str] = field(default_factory=list)
+    class_skill_list: Tuple[str, ...] = ()
+    # Per-table unlock index for _progression_upto, rebuilt when a table's keys change.
+    _progression_index: Dict[str, tuple] = field(default_factory=dict, init=False, repr=False, compare=False)
+    # (name, id, save list) and the resolved save proficiencies, see _class_save_proficiencies.
+    _save_prof_cache: Tuple[tuple, frozenset] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Class":
+        g = data.get
         class_id = DEFAULT_ID_REGISTRY.register(
-            ensure_typed_id(data.get("id", "class.unknown"), expected_prefix="class", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
+            ensure_typed_id(g("id", "class.unknown"), expected_prefix="class", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
             expected_prefix="class",
         )
-        raw_skill_choices = data.get("skill_choice_count", data.get("skill_choices"))
-
         return cls(
             id=class_id,
-            name=data.get("name", ""),
-            archetype_id=data.get("archetype_id"),
-            hit_die=int(data.get("hit_die", 6)),
-            save_proficiencies=list(data.get("save_proficiencies", [])),
-            ability_bonuses=data.get("ability_bonuses", {}),
-            bonuses=data.get("bonuses", {}),
-            proficiency_packs=data.get("proficiency_packs", {}),
-            feature_progression=data.get("feature_progression", {}),
-            spell_progression=data.get("spell_progression", {}),
-            choice_slots=data.get("choice_slots", {}),
-            skill_choice_count=int(data.get("skill_choice_count", data.get("skill_choices", 0))),
-            class_skill_list=list(
-                data.get("class_skill_list", data.get("class_skills", []))
+            name=g("name", ""),
+            archetype_id=g("archetype_id"),
+            hit_die=int(g("hit_die", 6)),
+            save_proficiencies=list(g("save_proficiencies", [])),
+            ability_bonuses={k: int(v) for k, v in g("ability_bonuses", {}).items()},
+            bonuses=g("bonuses", {}),
+            proficiency_packs=g("proficiency_packs", {}),
+            feature_progression=g("feature_progression", {}),
+            spell_progression=g("spell_progression", {}),
+            choice_slots=g("choice_slots", {}),
+            skill_choice_count=int(g("skill_choice_count", g("skill_choices", 0))),
+            class_skill_list=tuple(
+                g("class_skill_list", g("class_skills", ()))
             ),
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class Feat(Serializable):
     id: str
     name: str
@@ -151,31 +274,27 @@ class Feat(Serializable):
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "Feat":
-        raw_rule = data.get("stacking_rule", FeatStackingRule.UNIQUE.value)
-        stacking_rule = (
-            raw_rule
-            if isinstance(raw_rule, FeatStackingRule)
-            else FeatStackingRule(str(raw_rule))
-            if raw_rule is not None
-            else FeatStackingRule.UNIQUE
-        )
+        g = data.get
+        raw_rule = g("stacking_rule", FeatStackingRule.UNIQUE)
+        if raw_rule is None:
+            stacking_rule = FeatStackingRule.UNIQUE
+        elif isinstance(raw_rule, FeatStackingRule):
+            stacking_rule = raw_rule
+        else:
+            stacking_rule = FeatStackingRule(str(raw_rule))
         feat_id = DEFAULT_ID_REGISTRY.register(
-            ensure_typed_id(data.get("id", "feat.unknown"), expected_prefix="feat", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
+            ensure_typed_id(g("id", "feat.unknown"), expected_prefix="feat", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
             expected_prefix="feat",
         )
         return cls(
             id=feat_id,
-            name=data.get("name", ""),
-            description=data.get("description", ""),
-            modifiers=data.get("modifiers", {}),
-            required_level=(
-                int(data["required_level"])
-                if data.get("required_level") is not None
-                else None
-            ),
-            required_abilities={k: int(v) for k, v in data.get("required_abilities", {}).items()},
-            required_classes=list(data.get("required_classes", [])),
-            required_archetypes=list(data.get("required_archetypes", [])),
+            name=g("name", ""),
+            description=g("description", ""),
+            modifiers=g("modifiers", {}),
+            required_level=int(required_level) if (required_level := g("required_level")) is not None else None,
+            required_abilities={k: int(v) for k, v in g("required_abilities", {}).items()},
+            required_classes=list(g("required_classes", [])),
+            required_archetypes=list(g("required_archetypes", [])),
             stacking_rule=stacking_rule,
         )
 
@@ -184,10 +303,19 @@ class FeatValidator:
     def __init__(self, character: "PlayerCharacter") -> None:
         self.character = character
 
-    def validate(self, feat: "Feat", *, existing_feats: List["Feat"] | None = None) -> None:
-        existing = existing_feats if existing_feats is not None else self.character.feats
+    def validate(
+        self,
+        feat: "Feat",
+        *,
+        existing_feats: List["Feat"] | None = None,
+        existing_ids: set[str] | None = None,
+    ) -> None:
         self._validate_prerequisites(feat)
-        self._validate_stacking(feat, existing)
+        # Only unique feats consult the taken ids, so other feats skip building the set.
+        if existing_ids is None and feat.stacking_rule == FeatStackingRule.UNIQUE:
+            existing = existing_feats if existing_feats is not None else self.character.feats
+            existing_ids = {existing_feat.id for existing_feat in existing}
+        self._validate_stacking(feat, existing_ids)
 
     def _validate_prerequisites(self, feat: "Feat") -> None:
         if feat.required_level is not None and self.character.level < feat.required_level:
@@ -209,13 +337,12 @@ class FeatValidator:
                 f"{feat.name} requires archetype in {', '.join(feat.required_archetypes)}"
             )
 
-    def _validate_stacking(self, feat: "Feat", existing_feats: List["Feat"]) -> None:
-        if feat.stacking_rule == FeatStackingRule.UNIQUE:
-            if any(existing.id == feat.id for existing in existing_feats):
-                raise ValueError(f"{feat.name} can only be taken once")
+    def _validate_stacking(self, feat: "Feat", existing_ids: set[str] | None) -> None:
+        if feat.stacking_rule == FeatStackingRule.UNIQUE and feat.id in existing_ids:
+            raise ValueError(f"{feat.name} can only be taken once")
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerCharacter(Serializable):
     id: str
     name: str
@@ -245,10 +372,19 @@ class PlayerCharacter(Serializable):
     available_proficiency_packs: Dict[str, List[str]] = field(default_factory=dict)
     skill_proficiencies: set[str] = field(default_factory=set)
     _cached_modifiers: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    # (race, class, feats, equipped items, merged modifiers), see _collect_modifiers.
+    _base_modifiers: Tuple[Race, Class, Tuple[Feat, ...], Tuple[Item, ...], Dict[str, int]] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _proficiency_packs_source: Tuple[Race, Class] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _dirty: bool = field(default=False, init=False, repr=False, compare=False)
+    _batch_depth: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         self._validate_feats(self.feats)
-        self.recompute_statistics()
+        self._refresh_statistics()
         if self.current_hit_points is None:
             self.current_hit_points = self.hit_points
         self.current_hit_points = min(self.current_hit_points, self.hit_points)
@@ -258,39 +394,88 @@ class PlayerCharacter(Serializable):
 
     def _validate_feats(self, feats: List["Feat"]) -> None:
         validator = FeatValidator(self)
-        validated: List[Feat] = []
+        validated_ids: set[str] = set()
         for feat in feats:
-            validator.validate(feat, existing_feats=validated)
-            validated.append(feat)
+            validator.validate(feat, existing_ids=validated_ids)
+            validated_ids.add(feat.id)
 
     def add_feat(self, feat: "Feat", *, validate: bool = True) -> None:
         if validate:
             FeatValidator(self).validate(feat)
         self.feats.append(feat)
-        self.recompute_statistics()
+        self._statistics_changed()
+
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """Defer recomputes from mutators in the block to a single one on exit.
+
+        Statistics, and the requirement and prerequisite checks made inside the block, reflect
+        the state from before it until the block exits or ``flush`` is called.
+        """
+
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._dirty:
+                self._refresh_statistics()
+
+    def flush(self) -> None:
+        """Apply recomputes deferred by an open ``batch_updates`` block now."""
+
+        if self._dirty:
+            self._refresh_statistics()
+
+    def _statistics_changed(self) -> None:
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._refresh_statistics()
 
     def recompute_statistics(self) -> None:
-        aggregated_modifiers = self._collect_modifiers()
+        """Re-derive every statistic from the character's current state.
 
-        self.granted_features = list(self.race.traits)
-        self.available_proficiency_packs = {
-            **self.race.proficiency_packs,
-            **self.character_class.proficiency_packs,
-        }
+        Always a full recompute, so in-place edits to the race, class, feat or equipment
+        modifier dicts and to the race or class proficiency packs are picked up.
+        """
+
+        self._base_modifiers = None
+        self._proficiency_packs_source = None
+        self._refresh_statistics()
+
+    def _refresh_statistics(self) -> None:
+        """Recompute after the character's own mutators, reusing the cached modifier total."""
 
-        progression_modifiers = self._collect_progression_modifiers()
-        for key, value in progression_modifiers.items():
-            aggregated_modifiers[key] = aggregated_modifiers.get(key, 0) + value
+        self._dirty = False
+        aggregated_modifiers = self._collect_modifiers()
+
+        race, character_class = self.race, self.character_class
+        self.granted_features = list(race.traits)
+        # The merged packs only change with the race or class, so mutator recomputes keep them;
+        # the public recompute_statistics re-merges them to pick up in-place edits.
+        packs_source = self._proficiency_packs_source
+        if packs_source is None or packs_source[0] is not race or packs_source[1] is not character_class:
+            self.available_proficiency_packs = {
+                **race.proficiency_packs,
+                **character_class.proficiency_packs,
+            }
+            self._proficiency_packs_source = (race, character_class)
+
+        progression = self._active_progression()
+        self._collect_progression_modifiers(aggregated_modifiers, progression)
 
         self._cached_modifiers = dict(aggregated_modifiers)
 
-        self.choice_slots = self._collect_choice_slots()
-        self.spellcasting = self._collect_spellcasting()
+        self.choice_slots = self._collect_choice_slots(progression)
+        self.spellcasting = self._collect_spellcasting(progression)
 
         self.skill_proficiencies = self._collect_skill_proficiencies()
 
-        for ability_name, ability_score in self.abilities.items():
-            bonus = aggregated_modifiers.get(ability_name, 0)
+        get_modifier = aggregated_modifiers.get
+        abilities = self.abilities
+        for ability_name, ability_score in abilities.items():
+            bonus = get_modifier(ability_name, 0)
             base_score = ability_score.base_score
             if base_score is None:
                 base_score = ability_score.score
@@ -299,26 +484,33 @@ class PlayerCharacter(Serializable):
             ability_score.score = total_score
             ability_score.modifier = (total_score - 10) // 2
 
-        self.proficiency_bonus = 2 + (self.level - 1) // 4
-
-        con_mod = self.abilities.get("constitution", AbilityScore()).modifier
-        dex_mod = self.abilities.get("dexterity", AbilityScore()).modifier
-        base_hp = max(1, self.character_class.hit_die + con_mod)
-        self.hit_points = self.level * base_hp + aggregated_modifiers.get("hit_points", 0)
-
-        self.armor_class = 10 + dex_mod + aggregated_modifiers.get("armor_class", 0)
+        constitution = abilities.get("constitution")
+        dexterity = abilities.get("dexterity")
+        con_mod = constitution.modifier if constitution is not None else 0
+        dex_mod = dexterity.modifier if dexterity is not None else 0
+        self.proficiency_bonus, self.hit_points, self.armor_class = _derive_vitals(
+            self.level,
+            self.character_class.hit_die,
+            con_mod,
+            dex_mod,
+            get_modifier("hit_points", 0),
+            get_modifier("armor_class", 0),
+        )
 
         self.save_proficiencies = self._collect_save_proficiencies()
-        ability_saves = {
-            ability: self.get_save_modifier(ability, aggregated_modifiers) for ability in ABILITIES
-        }
-        legacy_saves = {
-            legacy: self.get_save_modifier(legacy, aggregated_modifiers)
-            for legacy in ("fortitude", "reflex", "will")
-        }
-        self.saves = {**ability_saves, **legacy_saves}
-
-        self.initiative = dex_mod + self.proficiency_bonus + aggregated_modifiers.get("initiative", 0)
+        # Inline get_save_modifier over the fixed save table instead of one method call per save.
+        save_proficiencies = self.save_proficiencies
+        proficiency_bonus = self.proficiency_bonus
+        saves: Dict[str, int] = {}
+        for save_key, ability_key in _SAVE_ABILITIES:
+            ability_score = abilities.get(ability_key)
+            total = (ability_score.modifier if ability_score is not None else 0) + get_modifier(save_key, 0)
+            if ability_key in save_proficiencies:
+                total += proficiency_bonus
+            saves[save_key] = total
+        self.saves = saves
+
+        self.initiative = dex_mod + proficiency_bonus + get_modifier("initiative", 0)
 
         if self.current_hit_points is not None:
             self.current_hit_points = min(self.current_hit_points, self.hit_points)
@@ -326,60 +518,23 @@ class PlayerCharacter(Serializable):
                 self.is_alive = False
 
     def _collect_save_proficiencies(self) -> set[str]:
-        proficiencies: set[str] = set()
-
-        legacy_to_ability = {
-            "fortitude": "constitution",
-            "reflex": "dexterity",
-            "will": "wisdom",
-        }
-
-        def add_class_defaults(key: str) -> None:
-            if key:
-                proficiencies.update(CLASS_SAVE_PROFICIENCIES.get(key, []))
-
-        add_class_defaults(str(getattr(self.character_class, "name", "")).lower())
-
-        class_id = str(getattr(self.character_class, "id", "")).lower()
-        if class_id.startswith("class-"):
-            add_class_defaults(class_id.removeprefix("class-"))
-        elif class_id.startswith("class."):
-            add_class_defaults(class_id.split(".", 1)[1])
-
-        for source in (
-            getattr(self.character_class, "save_proficiencies", []),
-            getattr(self.race, "save_proficiencies", []),
-        ):
-            for save in source:
-                save_key = str(save).lower()
-                ability_key = legacy_to_ability.get(save_key, save_key)
-                if ability_key in ABILITIES:
-                    proficiencies.add(ability_key)
-
+        proficiencies = set(_class_save_proficiencies(self.character_class))
+        proficiencies.update(_save_proficiency_abilities(getattr(self.race, "save_proficiencies", [])))
         return proficiencies
 
     def is_save_proficient(self, save: str) -> bool:
         save_key = str(save).lower()
-        legacy_to_ability = {
-            "fortitude": "constitution",
-            "reflex": "dexterity",
-            "will": "wisdom",
-        }
-        ability_key = legacy_to_ability.get(save_key, save_key)
+        ability_key = _LEGACY_SAVE_TO_ABILITY.get(save_key, save_key)
         return ability_key in self.save_proficiencies
 
     def get_save_modifier(
         self, save: str, aggregated_modifiers: Dict[str, int] | None = None
     ) -> int:
         save_key = str(save).lower()
-        legacy_to_ability = {
-            "fortitude": "constitution",
-            "reflex": "dexterity",
-            "will": "wisdom",
-        }
-        ability_key = legacy_to_ability.get(save_key, save_key)
+        ability_key = _LEGACY_SAVE_TO_ABILITY.get(save_key, save_key)
 
-        ability_mod = self.abilities.get(ability_key, AbilityScore()).modifier
+        ability_score = self.abilities.get(ability_key)
+        ability_mod = ability_score.modifier if ability_score is not None else 0
         modifiers = aggregated_modifiers if aggregated_modifiers is not None else {}
         total = ability_mod + modifiers.get(save_key, 0)
         if self.is_save_proficient(ability_key):
@@ -387,113 +542,128 @@ class PlayerCharacter(Serializable):
         return total
 
     def _collect_skill_proficiencies(self) -> set[str]:
-        proficiencies: set[str] = set()
-
-        for name, skill in self.skills.items():
-            if str(skill.proficiency).lower() != "untrained":
-                proficiencies.add(str(name).lower())
-
-        for pack in (self.race.proficiency_packs, self.character_class.proficiency_packs):
-            for entries in pack.values():
-                for entry in entries:
-                    if (skill_name := str(entry).lower()) in SKILL_TO_ABILITY:
-                        proficiencies.add(skill_name)
-
+        proficiencies = {
+            name.lower() for name, skill in self.skills.items() if skill.proficiency.lower() != _UNTRAINED
+        }
+        proficiencies.update(
+            skill_name
+            for pack in (self.race.proficiency_packs, self.character_class.proficiency_packs)
+            for entries in pack.values()
+            for entry in entries
+            if (skill_name := entry.lower()) in SKILL_TO_ABILITY
+        )
         return proficiencies
 
-    def _collect_modifiers(self) -> Dict[str, int]:
-        modifiers: Dict[str, int] = {}
+    def _collect_modifiers(self, modifiers: DefaultDict[str, int] | None = None) -> Dict[str, int]:
+        """Aggregate race, class, feat, equipment and status-effect modifiers.
+
+        The race/class/feat/equipment total is reused while the race, class, feats and equipped
+        items are the same objects, so adding, removing or replacing any of them (directly or
+        through the mutators) rebuilds it. The public ``recompute_statistics`` drops it, which
+        picks up in-place edits to their modifier dicts. Status effects are merged fresh on
+        every call, since combat code ticks and appends them directly.
+        """
+
+        race, character_class = self.race, self.character_class
+        feats = tuple(self.feats)
+        equipped = tuple(self.equipment.values())
+        cached = self._base_modifiers
+        # Tuple comparison checks identity first, so unchanged sources cost no __eq__ calls.
+        if (
+            cached is None
+            or cached[0] is not race
+            or cached[1] is not character_class
+            or cached[2] != feats
+            or cached[3] != equipped
+        ):
+            base: DefaultDict[str, int] = defaultdict(int)
+            # Fresh characters have mostly empty sources; skip the merge call for those.
+            for bonus_source in (race.bonuses, character_class.bonuses):
+                if bonus_source:
+                    _merge_int_dicts(base, bonus_source)
 
-        def merge(source: Dict[str, int]) -> None:
-            for key, value in source.items():
-                modifiers[key] = modifiers.get(key, 0) + int(value)
+            for feat in feats:
+                if feat.modifiers:
+                    _merge_int_dicts(base, feat.modifiers)
 
-        for bonus_source in (self.race.bonuses, self.character_class.bonuses):
-            merge(bonus_source)
+            for item in equipped:
+                if item_modifiers := getattr(item, "modifiers", None):
+                    _merge_int_dicts(base, item_modifiers)
 
-        for feat in self.feats:
-            merge(feat.modifiers)
+            cached = self._base_modifiers = (race, character_class, feats, equipped, dict(base))
 
-        for item in self.equipment.values():
-            merge(getattr(item, "modifiers", {}))
+        if modifiers is None:
+            modifiers = defaultdict(int, cached[4])
+        else:
+            _merge_int_dicts(modifiers, cached[4])
 
+        # Scale each effect's modifiers straight into the accumulator rather than building the
+        # intermediate ``total_modifiers()`` dict per effect.
         for effect in self.status_effects:
-            merge(effect.total_modifiers())
+            stacks = effect.current_stacks
+            for key, value in effect.modifiers.items():
+                modifiers[key] += int(value * stacks)
 
         return modifiers
 
-    def _collect_progression_modifiers(self) -> Dict[str, int]:
-        modifiers: Dict[str, int] = {}
-
-        def merge(source: Dict[str, int]) -> None:
-            for key, value in source.items():
-                modifiers[key] = modifiers.get(key, 0) + int(value)
-
-        for entry in self._progression_entries(self.race.feature_progression):
-            merge(entry.get("modifiers", {}))
-            self._append_features(entry)
-        for entry in self._progression_entries(self.character_class.feature_progression):
-            merge(entry.get("modifiers", {}))
+    def _collect_progression_modifiers(
+        self,
+        modifiers: DefaultDict[str, int] | None = None,
+        progression: List[Dict[str, object]] | None = None,
+    ) -> Dict[str, int]:
+        """Merge level-gated progression modifiers into ``modifiers`` (a fresh one by default)."""
+
+        if modifiers is None:
+            modifiers = defaultdict(int)
+        if progression is None:
+            progression = self._active_progression()
+
+        for entry in progression:
+            if entry_modifiers := entry.get("modifiers"):
+                _merge_int_dicts(modifiers, entry_modifiers)
             self._append_features(entry)
 
         return modifiers
 
-    def _collect_choice_slots(self) -> Dict[str, int]:
-        slots: Dict[str, int] = {}
-
-        def merge(source: Dict[str, int]) -> None:
-            for key, value in source.items():
-                slots[key] = slots.get(key, 0) + int(value)
-
-        merge(self.race.choice_slots)
-        merge(self.character_class.choice_slots)
+    def _collect_choice_slots(self, progression: List[Dict[str, object]] | None = None) -> Dict[str, int]:
+        slots: DefaultDict[str, int] = defaultdict(int)
+        for slot_source in (self.race.choice_slots, self.character_class.choice_slots):
+            if slot_source:
+                _merge_int_dicts(slots, slot_source)
 
-        for entry in self._progression_entries(self.race.feature_progression):
-            merge(entry.get("choice_slots", {}))
-        for entry in self._progression_entries(self.character_class.feature_progression):
-            merge(entry.get("choice_slots", {}))
+        for entry in progression if progression is not None else self._active_progression():
+            if entry_slots := entry.get("choice_slots"):
+                _merge_int_dicts(slots, entry_slots)
 
-        return slots
+        return dict(slots)
 
-    def _collect_spellcasting(self) -> Dict[str, int]:
-        spellcasting: Dict[str, int] = {}
+    def _collect_spellcasting(self, progression: List[Dict[str, object]] | None = None) -> Dict[str, int]:
+        spellcasting: DefaultDict[str, int] = defaultdict(int)
 
+        # Circles may be authored as ints or strings; unlike _merge_int_dicts, normalise the keys.
         def merge(source: Dict[str, int]) -> None:
             for circle, value in source.items():
-                spellcasting[str(circle)] = spellcasting.get(str(circle), 0) + int(value)
+                spellcasting[str(circle)] += int(value)
 
-        for entry in self._progression_entries(self.race.feature_progression):
-            merge(entry.get("spell_slots", {}))
-        for entry in self._progression_entries(self.character_class.feature_progression):
-            merge(entry.get("spell_slots", {}))
+        for entry in progression if progression is not None else self._active_progression():
+            if entry_slots := entry.get("spell_slots"):
+                merge(entry_slots)
 
-        for level, slots in self.race.spell_progression.items():
-            try:
-                level_int = int(level)
-            except (TypeError, ValueError):
-                continue
-            if level_int <= self.level:
-                merge(slots)
-        for level, slots in self.character_class.spell_progression.items():
-            try:
-                level_int = int(level)
-            except (TypeError, ValueError):
-                continue
-            if level_int <= self.level:
+        for source in (self.race, self.character_class):
+            for slots in _progression_upto(source, "spell_progression", self.level):
                 merge(slots)
 
-        return spellcasting
+        return dict(spellcasting)
 
-    def _progression_entries(self, progression: Dict[int, Dict[str, object]]) -> List[Dict[str, object]]:
-        entries: List[Dict[str, object]] = []
-        for level, payload in progression.items():
-            try:
-                level_int = int(level)
-            except (TypeError, ValueError):
-                continue
-            if level_int <= self.level and isinstance(payload, dict):
-                entries.append(payload)
-        return entries
+    def _active_progression(self) -> List[Dict[str, object]]:
+        """Feature progression entries unlocked at the current level, race entries first."""
+
+        return [
+            payload
+            for source in (self.race, self.character_class)
+            for payload in _progression_upto(source, "feature_progression", self.level)
+            if isinstance(payload, dict)
+        ]
 
     def _append_features(self, entry: Dict[str, object]) -> None:
         features = entry.get("features", [])
@@ -502,7 +672,8 @@ class PlayerCharacter(Serializable):
 
     @classmethod
     def from_dict(cls, data: Dict[str, object]) -> "PlayerCharacter":
-        abilities_data = data.get("abilities", {})
+        g = data.get
+        abilities_data = g("abilities", {})
         abilities: Dict[str, AbilityScore] = {}
         for name, value in abilities_data.items():
             if isinstance(value, dict):
@@ -510,7 +681,7 @@ class PlayerCharacter(Serializable):
             else:
                 abilities[name] = AbilityScore(name=name, score=int(value))
 
-        skills_data = data.get("skills", {})
+        skills_data = g("skills", {})
         skills: Dict[str, Skill] = {}
         for name, value in skills_data.items():
             if isinstance(value, dict):
@@ -518,8 +689,8 @@ class PlayerCharacter(Serializable):
             else:
                 skills[name] = Skill(name=name, key_ability="", proficiency=str(value))
 
-        feats = [Feat.from_dict(feat) for feat in data.get("feats", [])]
-        equipment_data = data.get("equipment", {})
+        feats = [Feat.from_dict(feat) for feat in g("feats", [])]
+        equipment_data = g("equipment", {})
 
         pc_id = DEFAULT_ID_REGISTRY.register(
             ensure_typed_id(data["id"], expected_prefix="pc", allowed_prefixes=DEFAULT_ID_REGISTRY.allowed_prefixes),
@@ -528,38 +699,39 @@ class PlayerCharacter(Serializable):
 
         instance = cls(
             id=pc_id,
-            name=data.get("name", ""),
-            background=data.get("background", ""),
+            name=g("name", ""),
+            background=g("background", ""),
             abilities=abilities,
             skills=skills,
-            race=Race.from_dict(data.get("race", {})),
-            character_class=Class.from_dict(data.get("character_class", {})),
+            race=Race.from_dict(g("race", {})),
+            character_class=Class.from_dict(g("character_class", {})),
             feats=feats,
-            inventory=[Item.from_dict(item) for item in data.get("inventory", [])],
+            inventory=[Item.from_dict(item) for item in g("inventory", [])],
             equipment={
                 slot_value: Equipment.from_dict(equipment)
                 for slot, equipment in equipment_data.items()
                 if (slot_value := _safe_slot_conversion(slot)) is not None
             },
-            status_effects=[StatusEffect.from_dict(effect) for effect in data.get("status_effects", [])],
-            level=int(data.get("level", 1)),
-            xp=int(data.get("xp", 0)),
-            hit_points=int(data.get("hit_points", 0)),
-            current_hit_points=data.get("current_hit_points"),
-            is_alive=bool(data.get("is_alive", True)),
-            armor_class=int(data.get("armor_class", 10)),
-            saves=data.get("saves", {}),
-            save_proficiencies=set(data.get("save_proficiencies", [])),
-            initiative=int(data.get("initiative", 0)),
-            proficiency_bonus=int(data.get("proficiency_bonus", 2)),
+            status_effects=[StatusEffect.from_dict(effect) for effect in g("status_effects", [])],
+            level=int(g("level", 1)),
+            xp=int(g("xp", 0)),
+            hit_points=int(g("hit_points", 0)),
+            current_hit_points=g("current_hit_points"),
+            is_alive=bool(g("is_alive", True)),
+            armor_class=int(g("armor_class", 10)),
+            saves=g("saves", {}),
+            save_proficiencies=set(g("save_proficiencies", [])),
+            initiative=int(g("initiative", 0)),
+            proficiency_bonus=int(g("proficiency_bonus", 2)),
             scores_include_static_bonuses=bool(
-                data.get("scores_include_static_bonuses", False)
+                g("scores_include_static_bonuses", False)
             ),
         )
         return instance
 
     def to_dict(self) -> Dict[str, object]:
-        payload = super().to_dict()
+        # Explicit super(): slots=True rebuilds the class, so the zero-argument form breaks.
+        payload = super(PlayerCharacter, self).to_dict()
         payload["save_proficiencies"] = sorted(self.save_proficiencies)
         payload["equipment"] = {slot.value: item.to_dict() for slot, item in self.equipment.items()}
         return payload
@@ -571,7 +743,7 @@ class PlayerCharacter(Serializable):
                 break
         else:
             self.status_effects.append(effect)
-        self.recompute_statistics()
+        self._statistics_changed()
 
     def apply_damage(self, amount: int) -> None:
         if not self.is_alive:
@@ -587,28 +759,60 @@ class PlayerCharacter(Serializable):
 
     def gain_xp(self, amount: int) -> List[int]:
         self.xp += max(0, amount)
-        leveled_up: List[int] = []
-        while True:
-            next_level = self.level + 1
-            threshold = XP_THRESHOLDS.get(next_level)
-            if threshold is None or self.xp < threshold:
-                break
-            self.level = next_level
-            self.recompute_statistics()
-            if self.current_hit_points is None:
-                self.current_hit_points = self.hit_points
-            leveled_up.append(self.level)
+        # Jump straight to the level the new total reaches and recompute once for the whole gain.
+        new_level = level_for_xp(self.xp)
+        if new_level <= self.level:
+            return []
+        leveled_up = list(range(self.level + 1, new_level + 1))
+        self.level = new_level
+        self._statistics_changed()
+        if self.current_hit_points is None:
+            self.current_hit_points = self.hit_points
         return leveled_up
 
     def tick_status_effects(self, tick_type: DurationType = DurationType.TURNS) -> None:
         self.status_effects = [effect for effect in self.status_effects if effect.tick(tick_type)]
-        self.recompute_statistics()
+        # Always recompute: effects appended to ``status_effects`` directly, or restacked in place
+        # by ``StatusEffect.combine``, only reach the statistics here.
+        self._statistics_changed()
 
     def dispel_status_effects(self, dispel_type: DispelCondition = DispelCondition.ANY) -> None:
-        self.status_effects = [effect for effect in self.status_effects if not effect.can_be_dispelled(dispel_type)]
-        self.recompute_statistics()
+        self.status_effects = [
+            effect for effect in self.status_effects if not effect.can_be_dispelled(dispel_type)
+        ]
+        self._statistics_changed()
 
     def equip_item(self, item: Equipment) -> None:
+        self._place_equipment(item)
+        self._statistics_changed()
+
+    def equip_items(self, items: Iterable[Equipment]) -> List[Equipment]:
+        """Equip several items with a single statistics recompute.
+
+        Requirements see the bonuses of items placed earlier in the call, as with sequential
+        ``equip_item`` calls; only items that carry requirements force the pending recompute.
+        Items that cannot be placed (unmet requirements or slot conflicts) are skipped and
+        returned.
+        """
+
+        skipped: List[Equipment] = []
+        # Index the inventory once so each placement's membership check is a dict probe.
+        inventory_index: Dict[str, List[Item]] = {}
+        for owned in self.inventory:
+            inventory_index.setdefault(owned.id, []).append(owned)
+        with self.batch_updates():
+            for item in items:
+                if self._dirty and getattr(item, "requirements", None):
+                    self.flush()
+                try:
+                    self._place_equipment(item, inventory_index)
+                except ValueError:
+                    skipped.append(item)
+                    continue
+                self._statistics_changed()
+        return skipped
+
+    def _place_equipment(self, item: Equipment, inventory_index: Dict[str, List[Item]] | None = None) -> None:
         if not isinstance(item, Equipment):
             raise TypeError("Only equipment can be equipped")
 
@@ -631,10 +835,15 @@ class PlayerCharacter(Serializable):
         else:
             self.equipment[item.slot] = item
 
-        if item not in self.inventory:
-            self.inventory.append(item)
-
-        self.recompute_statistics()
+        if inventory_index is None:
+            if item not in self.inventory:
+                self.inventory.append(item)
+        else:
+            # Same equality test as ``item in inventory``, restricted to entries sharing the id.
+            same_id = inventory_index.setdefault(item.id, [])
+            if item not in same_id:
+                same_id.append(item)
+                self.inventory.append(item)
 
     def _validate_equipment_requirements(self, item: Equipment) -> None:
         requirements = getattr(item, "requirements", {}) or {}
@@ -677,16 +886,20 @@ class PlayerCharacter(Serializable):
 
     def unequip(self, slot: EquipmentSlot) -> Equipment | None:
         removed = self.equipment.pop(slot, None)
-        self.recompute_statistics()
+        self._statistics_changed()
         return removed
 
     def _normalize_ability(self, ability: str) -> str:
+        if type(ability) is str and ability in _ABILITY_NAMES:
+            return ability
         ability_name = str(ability).lower()
-        if ability_name not in ABILITIES:
+        if ability_name not in _ABILITY_NAMES:
             raise KeyError(f"Unknown ability '{ability}'")
         return ability_name
 
     def _normalize_skill(self, skill: str) -> str:
+        if type(skill) is str and skill in SKILL_TO_ABILITY:
+            return skill
         skill_name = str(skill).lower()
         if skill_name not in SKILL_TO_ABILITY:
             raise KeyError(f"Unknown skill '{skill}'")
@@ -709,12 +922,14 @@ class PlayerCharacter(Serializable):
 
     def get_skill_modifier(self, skill: str) -> int:
         skill_name = self._normalize_skill(skill)
-        ability = SKILL_TO_ABILITY[skill_name]
-        modifier = self.get_ability_modifier(ability)
+        # SKILL_TO_ABILITY values are canonical ability names, so skip re-normalising them.
+        modifier = self.abilities[SKILL_TO_ABILITY[skill_name]].modifier
         modifier += self._cached_modifiers.get(skill_name, 0)
-        if self.is_skill_proficient(skill_name):
+        if skill_name in self.skill_proficiencies:
             modifier += self.proficiency_bonus
         return modifier
+
+
 XP_THRESHOLDS: Dict[int, int] = {
     1: 0,
     2: 300,
@@ -722,3 +937,12 @@ XP_THRESHOLDS: Dict[int, int] = {
     4: 2700,
     5: 6500,
 }
+XP_THRESHOLD_LEVELS: Tuple[int, ...] = tuple(sorted(XP_THRESHOLDS))
+XP_THRESHOLD_VALUES: Tuple[int, ...] = tuple(XP_THRESHOLDS[level] for level in XP_THRESHOLD_LEVELS)
+
+
+def level_for_xp(xp: int) -> int:
+    """Return the highest level whose XP threshold ``xp`` has reached."""
+
+    index = bisect_right(XP_THRESHOLD_VALUES, xp) - 1
+    return XP_THRESHOLD_LEVELS[max(index, 0)]
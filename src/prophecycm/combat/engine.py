@@ -11,6 +11,9 @@ from prophecycm.combat.status_effects import DurationType
 from prophecycm.core import Serializable
 from prophecycm.items.item import Consumable
 
+# Read-only stand-in for a missing ability, so lookups don't allocate a default per call.
+_NO_ABILITY = AbilityScore()
+
 
 @dataclass
 class CombatantRef(Serializable):
@@ -122,7 +125,7 @@ def roll_initiative(
 ) -> List[TurnOrderEntry]:
     entries_with_keys: List[tuple[TurnOrderEntry, tuple[float, float, str, float]]] = []
 
-    pc_dex_mod = pc.abilities.get("dexterity", AbilityScore()).modifier
+    pc_dex_mod = pc.abilities.get("dexterity", _NO_ABILITY).modifier
     pc_init_roll = rng.randint(1, 20) + pc.initiative
     entries_with_keys.append(
         (
@@ -133,7 +136,7 @@ def roll_initiative(
 
     allies = allies or []
     for ally in allies:
-        dex_mod = ally.abilities.get("dexterity", AbilityScore()).modifier
+        dex_mod = ally.abilities.get("dexterity", _NO_ABILITY).modifier
         init_mod = dex_mod + ally.proficiency_bonus
         roll = rng.randint(1, 20) + init_mod
         entries_with_keys.append(
@@ -144,7 +147,7 @@ def roll_initiative(
         )
 
     for creature in creatures:
-        dex_mod = creature.abilities.get("dexterity", AbilityScore()).modifier
+        dex_mod = creature.abilities.get("dexterity", _NO_ABILITY).modifier
         init_mod = dex_mod + creature.proficiency_bonus
         roll = rng.randint(1, 20) + init_mod
         entries_with_keys.append(
@@ -169,7 +172,7 @@ def resolve_attack(
     if callable(modifier_collector):
         aggregated_modifiers = modifier_collector()
 
-    ability = attacker.abilities.get(action.attack_ability, AbilityScore())
+    ability = attacker.abilities.get(action.attack_ability, _NO_ABILITY)
     attack_mod = (
         ability.modifier
         + getattr(attacker, "proficiency_bonus", 0)
@@ -196,6 +199,29 @@ def resolve_attack(
     return AttackResult(hit=False, crit=False, damage=0, target_died=False)
 
 
+def apply_damage_batch(creatures: Sequence[Creature], damage: Sequence[int]) -> List[bool]:
+    """Apply ``damage[i]`` to ``creatures[i]`` and return which creatures are still alive.
+
+    Equivalent to calling ``Creature.apply_damage`` per creature, inlined for autoresolve and
+    balance simulations that resolve many hits at once.
+    """
+
+    if len(creatures) != len(damage):
+        raise ValueError("creatures and damage must have the same length")
+
+    alive: List[bool] = []
+    for creature, amount in zip(creatures, damage):
+        if creature.is_alive:
+            remaining = (creature.current_hit_points or 0) - (amount if amount > 0 else 0)
+            if remaining <= 0:
+                creature.current_hit_points = 0
+                creature.is_alive = False
+            else:
+                creature.current_hit_points = remaining
+        alive.append(creature.is_alive)
+    return alive
+
+
 def use_consumable_in_combat(
     pc: PlayerCharacter, item: Consumable, target: Creature | PlayerCharacter
 ) -> bool:
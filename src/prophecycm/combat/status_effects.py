@@ -54,7 +54,7 @@ class StatusEffect(Serializable):
             id=data["id"],
             name=data.get("name", ""),
             duration=int(data.get("duration", 0)),
-            modifiers=data.get("modifiers", {}),
+            modifiers={key: int(value) for key, value in data.get("modifiers", {}).items()},
             source=data.get("source", ""),
             stacking_rule=stacking_rule,
             max_stacks=int(data.get("max_stacks", 1)),
@@ -100,4 +100,6 @@ class StatusEffect(Serializable):
             self.duration = max(self.duration, incoming.duration)
 
     def total_modifiers(self) -> Dict[str, int]:
+        """Stack-scaled modifiers; values are ints (``from_dict`` coerces authored values)."""
+
         return {key: value * self.current_stacks for key, value in self.modifiers.items()}
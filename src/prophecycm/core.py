@@ -2,7 +2,7 @@ from __future__ import annotations
 
 """Core utilities and base classes shared across the ProphecyCM codebase."""
 
-from dataclasses import asdict, is_dataclass
+from dataclasses import fields, is_dataclass
 from enum import Enum
 import json
 from typing import Any, Dict, Type, TypeVar
@@ -10,22 +10,34 @@ from typing import Any, Dict, Type, TypeVar
 T = TypeVar("T", bound="Serializable")
 
 
+def _to_serializable(value: Any) -> Any:
+    """Convert dataclasses, enums and containers into plain JSON-friendly values.
+
+    Dataclass fields declared with ``compare=False`` are derived caches and are not serialized.
+    """
+
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return [_to_serializable(v) for v in value]
+    if isinstance(value, dict):
+        return {k: _to_serializable(v) for k, v in value.items()}
+    if is_dataclass(value) and not isinstance(value, type):
+        return {
+            f.name: _to_serializable(getattr(value, f.name))
+            for f in fields(value)
+            if f.compare
+        }
+    return value
+
+
 class Serializable:
     """Simple dataclass-aware serialization mixin."""
 
+    __slots__ = ()
+
     def to_dict(self) -> Dict[str, Any]:
-        def convert(value: Any) -> Any:
-            if isinstance(value, Enum):
-                return value.value
-            if isinstance(value, (list, tuple, set, frozenset)):
-                return [convert(v) for v in value]
-            if isinstance(value, dict):
-                return {k: convert(v) for k, v in value.items()}
-            if is_dataclass(value):
-                return convert(asdict(value))
-            return value
-
-        return convert(asdict(self))
+        return _to_serializable(self)
 
     def to_json(self) -> str:
         return json.dumps(self.to_dict(), sort_keys=True)
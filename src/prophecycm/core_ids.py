@@ -11,6 +11,7 @@ checks so that content parsing can enforce consistency across the project.
 
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from typing import Dict, Iterable, Set
 
 DEFAULT_PREFIXES: Set[str] = {
@@ -46,11 +47,16 @@ def build_id(prefix: str, value: str) -> str:
     return f"{prefix}.{normalize_slug(value)}"
 
 
-def _pattern(allowed_prefixes: Iterable[str]) -> re.Pattern[str]:
+@lru_cache(maxsize=32)
+def _compiled_pattern(allowed_prefixes: frozenset[str]) -> re.Pattern[str]:
     joined = "|".join(sorted(allowed_prefixes))
     return re.compile(rf"^(?:{joined})\.[a-z0-9]+(?:[-_][a-z0-9]+)*$")
 
 
+def _pattern(allowed_prefixes: Iterable[str]) -> re.Pattern[str]:
+    return _compiled_pattern(frozenset(allowed_prefixes))
+
+
 def ensure_typed_id(value: str, *, expected_prefix: str | None = None, allowed_prefixes: Iterable[str] = DEFAULT_PREFIXES) -> str:
     pattern = _pattern(allowed_prefixes)
     if pattern.match(value):
@@ -57,6 +57,17 @@ def _type_schema(py_type: Any, defs: Dict[str, JsonSchema]) -> Tuple[JsonSchema,
         items_schema, _ = _type_schema(item_type, defs)
         return {"type": "array", "items": items_schema}, False
 
+    if origin is tuple:
+        if len(args) == 2 and args[1] is Ellipsis:
+            items_schema, _ = _type_schema(args[0], defs)
+            return {"type": "array", "items": items_schema}, False
+        return {
+            "type": "array",
+            "prefixItems": [_type_schema(arg, defs)[0] for arg in args],
+            "minItems": len(args),
+            "maxItems": len(args),
+        }, False
+
     if origin in (dict, Dict := dict):
         value_type = args[1] if len(args) == 2 else Any
         value_schema, _ = _type_schema(value_type, defs)
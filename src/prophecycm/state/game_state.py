@@ -54,7 +54,7 @@ class GameState(Serializable):
         return cls(
             timestamp=data.get("timestamp", ""),
             pc=pc,
-            npcs=[NPC.from_dict(npc) for npc in data.get("npcs", [])],
+            npcs=NPC.from_dict_many(data.get("npcs", [])),
             creatures=[Creature.from_dict(creature) for creature in data.get("creatures", [])],
             locations=[Location.from_dict(loc) for loc in data.get("locations", [])],
             factions=[Faction.from_dict(faction) for faction in data.get("factions", [])],
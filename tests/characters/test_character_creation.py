@@ -2,12 +2,14 @@ from pathlib import Path
 
 import pytest
 
+from prophecycm.characters import Feat
 from prophecycm.characters.creation import (
     AbilityGenerationMethod,
     CharacterCreationSelection,
     CharacterCreator,
 )
 from prophecycm.content import ContentCatalog, load_start_menu_config, loaders
+from prophecycm.core_ids import DEFAULT_ID_REGISTRY
 from prophecycm.items import EquipmentSlot
 
 CONTENT_ROOT = Path("docs/data-model/fixtures")
@@ -196,3 +198,105 @@ def test_invalid_class_skill_selection_rejected():
 
     with pytest.raises(ValueError):
         creator.build_character(selection)
+
+
+def test_build_characters_validates_all_ability_assignments_first():
+    catalog, config = _load_creation_config()
+    creator = CharacterCreator(config, catalog.items)
+
+    character_class = config.classes[0]
+    character_class.skill_choice_count = 1
+    character_class.class_skill_list = ["stealth"]
+
+    def _selection(name, scores):
+        return CharacterCreationSelection(
+            name=name,
+            background_id=config.backgrounds[0].id,
+            race_id=config.races[0].id,
+            class_id=character_class.id,
+            ability_method=AbilityGenerationMethod.POINT_BUY,
+            ability_scores=scores,
+            trained_skills=["stealth"],
+            feat_ids=[config.feats[0].id],
+        )
+
+    results = creator.build_characters(
+        [_selection("Batch One", _point_buy_scores(config)), _selection("Batch Two", _point_buy_scores(config))]
+    )
+    assert [result.character.name for result in results] == ["Batch One", "Batch Two"]
+
+    with pytest.raises(ValueError, match="Selection 1"):
+        creator.build_characters(
+            [
+                _selection("Batch Three", _point_buy_scores(config)),
+                _selection("Batch Four", _point_buy_scores(config, inflate=True)),
+            ]
+        )
+    assert not any(typed_id.endswith("batch-three") for typed_id in DEFAULT_ID_REGISTRY.registered)
+
+
+def test_build_characters_registers_no_ids_when_a_feat_prerequisite_fails():
+    catalog, config = _load_creation_config()
+    config.feats.append(Feat(id="feat.epic-leaky", name="Epic Leaky", required_level=20))
+    creator = CharacterCreator(config, catalog.items)
+
+    character_class = config.classes[0]
+    character_class.skill_choice_count = 1
+    character_class.class_skill_list = ["stealth"]
+
+    def _selection(name, feat_id):
+        return CharacterCreationSelection(
+            name=name,
+            background_id=config.backgrounds[0].id,
+            race_id=config.races[0].id,
+            class_id=character_class.id,
+            ability_method=AbilityGenerationMethod.POINT_BUY,
+            ability_scores=_point_buy_scores(config),
+            trained_skills=["stealth"],
+            feat_ids=[feat_id],
+        )
+
+    with pytest.raises(ValueError, match="Selection 1 .*requires level 20"):
+        creator.build_characters(
+            [_selection("Leaky One", config.feats[0].id), _selection("Leaky Two", "feat.epic-leaky")]
+        )
+    assert "pc.leaky-one" not in DEFAULT_ID_REGISTRY.registered
+    assert "pc.leaky-two" not in DEFAULT_ID_REGISTRY.registered
+
+
+def test_ability_rules_follow_config_edits_after_the_creator_is_built():
+    catalog, config = _load_creation_config()
+    creator = CharacterCreator(config, catalog.items)
+
+    character_class = config.classes[0]
+    character_class.skill_choice_count = 1
+    character_class.class_skill_list = ["stealth"]
+
+    def _selection(name, method, scores):
+        return CharacterCreationSelection(
+            name=name,
+            background_id=config.backgrounds[0].id,
+            race_id=config.races[0].id,
+            class_id=character_class.id,
+            ability_method=method,
+            ability_scores=scores,
+            trained_skills=["stealth"],
+            feat_ids=[config.feats[0].id],
+        )
+
+    inflated = _point_buy_scores(config, inflate=True)
+    with pytest.raises(ValueError, match="exceeds budget"):
+        creator.build_character(_selection("Config Budget", AbilityGenerationMethod.POINT_BUY, inflated))
+
+    config.point_buy_total = 40
+    creator.build_character(_selection("Config Budget", AbilityGenerationMethod.POINT_BUY, inflated))
+
+    config.point_buy_costs[15] = 30
+    with pytest.raises(ValueError, match="exceeds budget"):
+        creator.build_character(_selection("Config Costs", AbilityGenerationMethod.POINT_BUY, inflated))
+
+    old_scores = _standard_scores(config)
+    config.standard_array = (16, 14, 13, 12, 10, 8)
+    with pytest.raises(ValueError, match="standard array"):
+        creator.build_character(_selection("Config Array", AbilityGenerationMethod.STANDARD_ARRAY, old_scores))
+    creator.build_character(_selection("Config Array", AbilityGenerationMethod.STANDARD_ARRAY, _standard_scores(config)))
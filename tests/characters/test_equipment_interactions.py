@@ -60,3 +60,99 @@ def test_equipment_and_effects_apply_and_revert_modifiers():
     pc.unequip(EquipmentSlot.ACCESSORY)
     assert pc.armor_class == base_ac
     assert pc.initiative == base_initiative
+
+
+def test_equip_items_places_batch_and_skips_conflicts():
+    pc = _build_pc()
+    base_ac = pc.armor_class
+
+    sabre = Equipment(id="eq-sabre", name="Sabre", slot=EquipmentSlot.MAIN_HAND)
+    buckler = Equipment(
+        id="eq-buckler", name="Buckler", slot=EquipmentSlot.OFF_HAND, modifiers={"armor_class": 2}
+    )
+    greatsword = Equipment(id="eq-greatsword", name="Greatsword", slot=EquipmentSlot.TWO_HAND)
+
+    skipped = pc.equip_items([sabre, buckler, greatsword])
+
+    assert skipped == [greatsword]
+    assert pc.equipment[EquipmentSlot.MAIN_HAND] == sabre
+    assert pc.equipment[EquipmentSlot.OFF_HAND] == buckler
+    assert EquipmentSlot.TWO_HAND not in pc.equipment
+    assert pc.armor_class == base_ac + 2
+    assert sabre in pc.inventory and buckler in pc.inventory
+
+
+def test_equip_items_adds_unowned_items_to_inventory_once():
+    pc = _build_pc()
+    owned = Equipment(id="eq-owned-band", name="Owned Band", slot=EquipmentSlot.ACCESSORY)
+    pc.inventory.append(owned)
+
+    helm = Equipment(id="eq-helm", name="Helm", slot=EquipmentSlot.HEAD)
+    pc.equip_items([Equipment(id="eq-owned-band", name="Owned Band", slot=EquipmentSlot.ACCESSORY), helm, helm])
+
+    assert pc.inventory == [owned, helm]
+
+
+def test_batch_updates_defer_recompute_until_exit_or_flush():
+    pc = _build_pc()
+    base_ac = pc.armor_class
+
+    with pc.batch_updates():
+        pc.equip_item(
+            Equipment(
+                id="eq-batch-buckler",
+                name="Batch Buckler",
+                slot=EquipmentSlot.OFF_HAND,
+                modifiers={"armor_class": 2},
+            )
+        )
+        pc.add_status_effect(
+            StatusEffect(id="status-batch-ward", name="Batch Ward", duration=2, modifiers={"armor_class": 1})
+        )
+        assert pc.armor_class == base_ac
+
+        pc.flush()
+        assert pc.armor_class == base_ac + 3
+
+        pc.unequip(EquipmentSlot.OFF_HAND)
+        assert pc.armor_class == base_ac + 3
+
+    assert pc.armor_class == base_ac + 1
+
+
+def test_recompute_picks_up_direct_equipment_edits():
+    pc = _build_pc()
+    base_ac = pc.armor_class
+    shield = Equipment(
+        id="eq-direct-shield", name="Direct Shield", slot=EquipmentSlot.OFF_HAND, modifiers={"armor_class": 2}
+    )
+
+    pc.equipment[EquipmentSlot.OFF_HAND] = shield
+    pc.recompute_statistics()
+    assert pc.armor_class == base_ac + 2
+
+    del pc.equipment[EquipmentSlot.OFF_HAND]
+    pc.recompute_statistics()
+    assert pc.armor_class == base_ac
+
+
+def test_tick_applies_effects_appended_directly():
+    pc = _build_pc()
+    base_ac = pc.armor_class
+
+    pc.status_effects.append(
+        StatusEffect(id="status-direct-ward", name="Direct Ward", duration=3, modifiers={"armor_class": 1})
+    )
+    pc.tick_status_effects()
+
+    assert pc.armor_class == base_ac + 1
+
+
+def test_recompute_picks_up_in_place_race_bonus_edits():
+    pc = _build_pc()
+    base_ac = pc.armor_class
+
+    pc.race.bonuses["armor_class"] = 2
+    pc.recompute_statistics()
+
+    assert pc.armor_class == base_ac + 2
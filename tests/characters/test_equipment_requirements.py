@@ -50,3 +50,27 @@ def test_equip_item_succeeds_when_requirements_met():
 
     assert EquipmentSlot.MAIN_HAND in pc.equipment
     assert pc.equipment[EquipmentSlot.MAIN_HAND].id == "eq-warhammer"
+
+
+def test_equip_items_requirements_see_earlier_items_in_the_batch():
+    pc = _base_pc(strength=12)
+
+    gauntlets = Equipment(
+        id="eq-ogre-gauntlets",
+        name="Ogre Gauntlets",
+        slot=EquipmentSlot.ACCESSORY,
+        modifiers={"strength": 4},
+    )
+    greataxe = Equipment(
+        id="eq-heavy-greataxe",
+        name="Heavy Greataxe",
+        slot=EquipmentSlot.TWO_HAND,
+        requirements={"abilities": {"strength": 16}},
+        two_handed=True,
+    )
+
+    skipped = pc.equip_items([gauntlets, greataxe])
+
+    assert skipped == []
+    assert pc.equipment[EquipmentSlot.TWO_HAND] == greataxe
+    assert pc.get_ability_score("strength") == 16
@@ -68,3 +68,124 @@ def test_recompute_applies_progressions_and_choices() -> None:
         "channel-divinity",
     }
     assert pc.available_proficiency_packs == {}
+
+
+def test_progression_tracks_level_and_table_edits() -> None:
+    character_class = Class(
+        id="class-ordered",
+        name="Ordered Adept",
+        hit_die=8,
+        feature_progression={
+            3: {"features": ["third"]},
+            "1": {"features": ["first"]},
+            2: {"features": ["second"], "spell_slots": {"1": 1}},
+        },
+    )
+    pc = PlayerCharacter(
+        id="pc-ordered",
+        name="Ordered Hero",
+        background="",
+        abilities={"constitution": AbilityScore(name="constitution", score=10)},
+        skills={},
+        race=Race(id="race-ordered", name="Ordered Folk"),
+        character_class=character_class,
+        level=2,
+    )
+
+    assert pc.granted_features == ["first", "second"]
+    assert pc.spellcasting == {"1": 1}
+
+    character_class.feature_progression[0] = {"features": ["zeroth"]}
+    pc.level = 3
+    pc.recompute_statistics()
+    assert pc.granted_features == ["third", "first", "second", "zeroth"]
+
+    # Same-size swap: the new key lands last, so the table is re-indexed.
+    del character_class.feature_progression[3]
+    character_class.feature_progression[4] = {"features": ["fourth"]}
+    pc.level = 4
+    pc.recompute_statistics()
+    assert pc.granted_features == ["first", "second", "zeroth", "fourth"]
+
+    character_class.feature_progression = {1: {"features": ["fresh"]}, "2": {"features": ["table"]}}
+    pc.recompute_statistics()
+    assert pc.granted_features == ["fresh", "table"]
+
+
+def test_proficiency_packs_follow_race_and_class_changes() -> None:
+    pc = PlayerCharacter(
+        id="pc-packs",
+        name="Pack Hero",
+        background="",
+        abilities={"constitution": AbilityScore(name="constitution", score=10)},
+        skills={},
+        race=Race(id="race-packs", name="Pack Folk", proficiency_packs={"scout": ["stealth"]}),
+        character_class=Class(id="class-packs", name="Pack Adept", hit_die=8),
+    )
+
+    assert pc.available_proficiency_packs == {"scout": ["stealth"]}
+
+    pc.character_class = Class(
+        id="class-packs-alt",
+        name="Pack Scholar",
+        hit_die=6,
+        proficiency_packs={"sage": ["history"]},
+    )
+    pc.recompute_statistics()
+    assert pc.available_proficiency_packs == {"scout": ["stealth"], "sage": ["history"]}
+
+    pc.race.proficiency_packs["warden"] = ["survival"]
+    pc.recompute_statistics()
+    assert pc.available_proficiency_packs == {
+        "scout": ["stealth"],
+        "warden": ["survival"],
+        "sage": ["history"],
+    }
+
+
+def test_save_proficiencies_follow_class_list_edits() -> None:
+    character_class = Class(id="class-warded", name="Warded Adept", hit_die=8, save_proficiencies=["will"])
+    pc = PlayerCharacter(
+        id="pc-warded",
+        name="Warded Hero",
+        background="",
+        abilities={"wisdom": AbilityScore(name="wisdom", score=12)},
+        skills={},
+        race=Race(id="race-warded", name="Warded Folk"),
+        character_class=character_class,
+    )
+
+    assert pc.save_proficiencies == {"wisdom"}
+
+    character_class.save_proficiencies.append("reflex")
+    pc.recompute_statistics()
+    assert pc.save_proficiencies == {"wisdom", "dexterity"}
+
+
+def test_gain_xp_jumps_several_levels_with_one_recompute(monkeypatch) -> None:
+    pc = PlayerCharacter(
+        id="pc-xp",
+        name="Swift Hero",
+        background="",
+        abilities={"constitution": AbilityScore(name="constitution", score=12)},
+        skills={},
+        race=Race(id="race-xp", name="Swift Folk"),
+        character_class=Class(id="class-xp", name="Swift Adept", hit_die=8),
+    )
+    recomputes = []
+    original = PlayerCharacter._refresh_statistics
+    monkeypatch.setattr(
+        PlayerCharacter,
+        "_refresh_statistics",
+        lambda self: (recomputes.append(self.level), original(self))[1],
+    )
+
+    assert pc.gain_xp(299) == []
+    assert pc.gain_xp(3000) == [2, 3, 4]
+    assert recomputes == [4]
+    assert pc.level == 4
+    assert pc.hit_points == 4 * 9
+
+    assert pc.gain_xp(100000) == [5]
+    assert pc.gain_xp(100000) == []
+    assert pc.level == 5
@@ -5,6 +5,7 @@ from prophecycm.characters.player import AbilityScore, PlayerCharacter, Class, R
 from prophecycm.combat.engine import (
     AttackResult,
     CombatantRef,
+    apply_damage_batch,
     EncounterState,
     EncounterResult,
     start_encounter,
@@ -158,6 +159,20 @@ def test_roll_dice_parses_expression():
     assert roll_dice("2d4+1", rng) >= 3
 
 
+def test_apply_damage_batch_matches_per_creature_damage():
+    batch = [build_creature("a"), build_creature("b"), build_creature("c")]
+    serial = [build_creature("a"), build_creature("b"), build_creature("c")]
+    damage = [2, -3, 500]
+
+    alive = apply_damage_batch(batch, damage)
+    for creature, amount in zip(serial, damage):
+        creature.apply_damage(amount)
+
+    assert alive == [True, True, False]
+    assert [c.current_hit_points for c in batch] == [c.current_hit_points for c in serial]
+    assert [c.is_alive for c in batch] == [c.is_alive for c in serial]
+
+
 def test_use_consumable_heals_creature_and_consumes_charge():
     pc = build_pc()
     creature = build_creature("wounded")
@@ -1,4 +1,8 @@
+import pytest
+
 from prophecycm.characters import AbilityScore, Creature, CreatureAction, CreatureTierTemplate, NPC, NPCScalingProfile
+from prophecycm.characters.npc import Difficulty
+from prophecycm.combat.status_effects import StatusEffect
 
 
 def test_npc_applies_scaling_to_attached_stat_block_only():
@@ -167,3 +171,381 @@ def test_npc_scaling_prefers_tier_templates_for_progression():
     assert advanced_scaled.hit_points > base_creature.hit_points
     assert advanced_scaled.actions[0].to_hit_bonus == 8
     assert advanced_scaled.actions[0].damage_bonus == 7
+
+
+def test_creature_status_effect_modifiers_refresh_after_mutation():
+    creature = Creature(
+        id="creature-warded",
+        name="Warded Husk",
+        level=1,
+        role="minion",
+        hit_die=6,
+        armor_class=11,
+        abilities={"dexterity": AbilityScore(name="dexterity", score=10)},
+        actions=[],
+    )
+    base_ac = creature.armor_class
+
+    creature.add_status_effect(StatusEffect(id="status-ward", name="Ward", duration=1, modifiers={"armor_class": 2}))
+    assert creature.armor_class == base_ac + 2
+
+    creature.tick_status_effects()
+    assert creature.status_effects == []
+    assert creature.armor_class == base_ac
+    assert "_modifier_cache" not in creature.to_dict()
+
+
+def test_creature_clone_matches_and_is_independent():
+    creature = Creature(
+        id="creature-clone",
+        name="Clone Husk",
+        level=3,
+        role="minion",
+        hit_die=6,
+        armor_class=11,
+        abilities={"dexterity": AbilityScore(name="dexterity", score=12)},
+        actions=[CreatureAction(name="Swipe", tags=["melee"])],
+        status_effects=[StatusEffect(id="status-ward", name="Ward", duration=2, modifiers={"armor_class": 1})],
+    )
+
+    clone = creature.clone()
+    assert clone == creature
+
+    clone.abilities["dexterity"].score = 18
+    clone.actions[0].tags.append("reach")
+    clone.status_effects[0].modifiers["armor_class"] = 5
+    assert creature.abilities["dexterity"].score == 12
+    assert creature.actions[0].tags == ["melee"]
+    assert creature.status_effects[0].modifiers == {"armor_class": 1}
+
+
+def test_creature_recompute_tracks_level_changes():
+    creature = Creature(
+        id="creature-grower",
+        name="Grower",
+        level=1,
+        role="brute",
+        hit_die=8,
+        armor_class=12,
+        abilities={"constitution": AbilityScore(name="constitution", score=12)},
+        actions=[],
+    )
+    base_hp = creature.hit_points
+
+    creature.set_level(3)
+    creature.recompute_statistics()
+    assert creature.hit_points == base_hp * 3
+
+    creature.level = 5
+    creature.recompute_statistics()
+    assert creature.hit_points == base_hp * 5
+    assert creature.proficiency_bonus == 3
+
+
+def test_npc_scaled_stat_block_cache_returns_independent_copies():
+    base_creature = Creature(
+        id="creature-cached",
+        name="Cached Beast",
+        level=2,
+        role="brute",
+        hit_die=8,
+        armor_class=12,
+        abilities={"strength": AbilityScore(name="strength", score=14)},
+        actions=[CreatureAction(name="Claw", to_hit_bonus=1, damage_bonus=1)],
+    )
+    npc = NPC(
+        id="npc-cached-handler",
+        archetype="enemy",
+        faction_id="rogues",
+        disposition="hostile",
+        stat_block=base_creature,
+        scaling=NPCScalingProfile(base_level=2, attack_progression=1),
+    )
+
+    first = npc.scaled_stat_block(player_level=4)
+    first.apply_damage(first.hit_points)
+    first.actions[0].to_hit_bonus = 99
+
+    second = npc.scaled_stat_block(player_level=4)
+    assert second is not first
+    assert second.is_alive and second.current_hit_points == second.hit_points
+    assert second.actions[0].to_hit_bonus == 3
+
+    base_creature.add_status_effect(StatusEffect(id="status-ward", name="Ward", duration=2, modifiers={"armor_class": 2}))
+    assert npc.scaled_stat_block(player_level=4).armor_class == second.armor_class + 2
+
+
+def test_npc_from_dict_many_matches_individual_loads():
+    payloads = [
+        {
+            "id": "npc-batch-one",
+            "archetype": "scout",
+            "faction_id": "wardens",
+            "disposition": "friendly",
+            "status_effects": [{"id": "status-ward", "name": "Ward", "duration": 2, "modifiers": {"armor_class": 1}}],
+        },
+        {"id": "npc-batch-two", "archetype": "guard", "faction_id": "wardens", "disposition": "neutral"},
+        {
+            "id": "npc-batch-three",
+            "archetype": "sage",
+            "faction_id": "circle",
+            "disposition": "friendly",
+            "status_effects": [
+                {"id": "status-focus", "name": "Focus", "duration": 1},
+                {"id": "status-haste", "name": "Haste", "duration": 3, "modifiers": {"speed": 10}},
+            ],
+        },
+    ]
+
+    assert NPC.from_dict_many(payloads) == [NPC.from_dict(payload) for payload in payloads]
+
+
+def test_npc_scaling_accepts_difficulty_enum():
+    npc = NPC(
+        id="npc-enum-difficulty",
+        archetype="enemy",
+        faction_id="rogues",
+        disposition="hostile",
+        stat_block=Creature(
+            id="creature-enum",
+            name="Enum Beast",
+            level=2,
+            role="brute",
+            hit_die=8,
+            armor_class=12,
+            abilities={"strength": AbilityScore(name="strength", score=14)},
+            actions=[CreatureAction(name="Claw", to_hit_bonus=1)],
+        ),
+        scaling=NPCScalingProfile(base_level=2, attack_progression=1),
+    )
+
+    for difficulty in Difficulty:
+        assert npc.scaled_stat_block(10, difficulty) == npc.scaled_stat_block(10, difficulty.name.lower())
+
+
+def test_npc_from_dict_parallel_matches_batched_load():
+    payloads = [
+        {
+            "id": f"npc-parallel-{index}",
+            "archetype": "guard",
+            "faction_id": "wardens",
+            "disposition": "neutral",
+            "stat_block": {"id": f"creature-parallel-{index}", "name": "Guard", "level": 1 + index % 5},
+            "scaling": {"base_level": 2, "attack_progression": 1},
+        }
+        for index in range(250)
+    ]
+
+    loaded = NPC.from_dict_parallel(payloads, workers=2)
+    assert loaded == NPC.from_dict_many(payloads)
+    assert loaded[0].scaling.difficulty_multipliers is NPC.from_dict(payloads[0]).scaling.difficulty_multipliers
+
+
+def test_npc_readonly_scaled_stat_block_is_a_frozen_view():
+    npc = NPC(
+        id="npc-readonly",
+        archetype="enemy",
+        faction_id="rogues",
+        disposition="hostile",
+        stat_block=Creature(
+            id="creature-readonly",
+            name="Readonly Beast",
+            level=2,
+            role="brute",
+            hit_die=8,
+            armor_class=12,
+            abilities={"strength": AbilityScore(name="strength", score=14)},
+            actions=[CreatureAction(name="Claw", to_hit_bonus=1)],
+        ),
+        scaling=NPCScalingProfile(base_level=2, attack_progression=1),
+    )
+
+    view = npc.scaled_stat_block(player_level=5, readonly=True)
+    assert view == npc.scaled_stat_block(player_level=5)
+    assert view.hit_points > npc.stat_block.hit_points
+
+    with pytest.raises(AttributeError):
+        view.current_hit_points = 0
+    with pytest.raises(AttributeError):
+        view.apply_damage(5)
+    with pytest.raises(TypeError):
+        view.abilities["strength"] = AbilityScore(name="strength", score=30)
+    with pytest.raises(TypeError):
+        view.tier_modifiers["armor_class"] = 5
+    with pytest.raises(AttributeError):
+        view.actions.append(CreatureAction(name="Bite"))
+    with pytest.raises(AttributeError):
+        view.status_effects.append(StatusEffect(id="status-sneaky", name="Sneaky", duration=1))
+    assert view.saves == npc.scaled_stat_block(player_level=5).saves
+
+    thawed = view.thaw()
+    thawed.apply_damage(thawed.hit_points)
+    assert npc.scaled_stat_block(player_level=5, readonly=True).is_alive
+
+
+def test_npc_from_dict_decodes_scaling_profile():
+    payload = {
+        "id": "npc-decoded",
+        "archetype": "enemy",
+        "faction_id": "rogues",
+        "disposition": "hostile",
+        "scaling": {"base_level": 3, "attack_progression": 2},
+    }
+
+    npc = NPC.from_dict(payload)
+
+    assert npc.scaling == NPCScalingProfile(base_level=3, attack_progression=2)
+    assert npc.to_dict() == NPC.from_dict(payload).to_dict()
+
+
+def test_creature_recompute_picks_up_direct_ability_edits():
+    creature = Creature(
+        id="creature-edited",
+        name="Edited Brute",
+        level=3,
+        role="brute",
+        hit_die=8,
+        armor_class=10,
+        abilities={
+            "constitution": AbilityScore(name="constitution", score=10),
+            "dexterity": AbilityScore(name="dexterity", score=10),
+        },
+        actions=[],
+    )
+    assert creature.hit_points == 15
+    assert creature.armor_class == 10
+
+    creature.abilities["constitution"].score = 20
+    creature.abilities["dexterity"].score = 20
+    creature.recompute_statistics()
+
+    assert creature.hit_points == 30
+    assert creature.armor_class == 15
+    assert creature.saves["reflex"] == 5
+
+
+def test_creature_tick_applies_effects_appended_directly():
+    creature = Creature(
+        id="creature-warded",
+        name="Warded Brute",
+        level=1,
+        role="brute",
+        hit_die=8,
+        armor_class=12,
+        abilities={"dexterity": AbilityScore(name="dexterity", score=10)},
+        actions=[],
+    )
+    creature.status_effects.append(
+        StatusEffect(id="status-creature-ward", name="Ward", duration=3, modifiers={"armor_class": 2})
+    )
+
+    creature.tick_status_effects()
+
+    assert creature.armor_class == 14
+
+
+def test_tiered_creatures_own_their_tier_modifiers():
+    creature = Creature(
+        id="creature-tiered",
+        name="Tiered Brute",
+        level=2,
+        role="brute",
+        hit_die=8,
+        armor_class=12,
+        abilities={"constitution": AbilityScore(name="constitution", score=10)},
+        actions=[],
+    )
+    tier = CreatureTierTemplate(name="tough", difficulty="hard", level_adjustment=1, hit_point_adjustment=5)
+
+    first = creature.apply_tier(tier)
+    second = creature.apply_tier(tier)
+    first.tier_modifiers["armor_class"] = 3
+
+    assert second.tier_modifiers == {"hit_points": 5}
+    assert tier.as_modifiers() == {"hit_points": 5}
+
+
+def test_untouched_tier_picks_up_direct_ability_edits():
+    creature = Creature(
+        id="creature-standard-tier",
+        name="Standard Brute",
+        level=2,
+        role="brute",
+        hit_die=8,
+        armor_class=12,
+        abilities={"constitution": AbilityScore(name="constitution", score=10)},
+        actions=[],
+    )
+    creature.abilities["constitution"].score = 20
+
+    tiered = creature.apply_tier(CreatureTierTemplate(name="standard", difficulty="standard"))
+
+    assert tiered.hit_points == (8 // 2 + 1 + 5) * 2
+    assert tiered.current_hit_points == tiered.hit_points
+
+
+def test_npc_scaled_stat_block_tracks_in_place_edits():
+    npc = NPC(
+        id="npc-stale",
+        archetype="enemy",
+        faction_id="rogues",
+        disposition="hostile",
+        stat_block=Creature(
+            id="creature-stale",
+            name="Stale Beast",
+            level=2,
+            role="brute",
+            hit_die=8,
+            armor_class=12,
+            abilities={"dexterity": AbilityScore(name="dexterity", score=10)},
+            actions=[CreatureAction(name="Claw", to_hit_bonus=1)],
+        ),
+        scaling=NPCScalingProfile(base_level=2, attack_progression=1),
+    )
+    scaled = npc.scaled_stat_block(player_level=5)
+    assert (scaled.armor_class, scaled.actions[0].to_hit_bonus) == (12, 4)
+
+    npc.stat_block.status_effects.append(
+        StatusEffect(id="status-stale-ward", name="Ward", duration=2, modifiers={"armor_class": 2})
+    )
+    assert npc.scaled_stat_block(player_level=5).armor_class == 14
+
+    npc.stat_block.abilities["dexterity"].score = 20
+    assert npc.scaled_stat_block(player_level=5, readonly=True).armor_class == 19
+
+    npc.scaling.attack_progression = 5
+    assert npc.scaled_stat_block(player_level=5).actions[0].to_hit_bonus == 16
+
+    npc.stat_block.actions[0].to_hit_bonus = 10
+    assert npc.scaled_stat_block(player_level=5).actions[0].to_hit_bonus == 25
+
+
+def test_npc_recomputes_direct_stat_block_edits_on_wrap_and_auto_level():
+    def _tough_creature() -> Creature:
+        return Creature(
+            id="creature-tough",
+            name="Tough Brute",
+            level=2,
+            role="brute",
+            hit_die=8,
+            armor_class=12,
+            abilities={"constitution": AbilityScore(name="constitution", score=10)},
+            actions=[],
+        )
+
+    creature = _tough_creature()
+    creature.abilities["constitution"].score = 20
+    wrapped = NPC(id="npc-tough", archetype="enemy", faction_id="rogues", disposition="hostile", stat_block=creature)
+    assert wrapped.stat_block.hit_points == 20
+
+    leveled = NPC(
+        id="npc-tough-leveled",
+        archetype="enemy",
+        faction_id="rogues",
+        disposition="hostile",
+        stat_block=_tough_creature(),
+    )
+    leveled.stat_block.abilities["constitution"].score = 20
+    leveled.level = 4
+    leveled.apply_auto_level()
+    assert leveled.stat_block.hit_points == 40
@@ -1,4 +1,5 @@
 from prophecycm.characters.player import AbilityScore, Class, PlayerCharacter, Race, Skill
+from prophecycm.characters.creature import Creature
 from prophecycm.content import seed_save_file
 from prophecycm.state import SaveFile
 
@@ -31,3 +32,33 @@ def test_player_character_skill_proficiencies_json_round_trip():
     loaded = PlayerCharacter.from_json(payload)
 
     assert "perception" in loaded.skill_proficiencies
+
+
+def test_repeated_loads_return_independent_races_and_classes():
+    payload = {"id": "race.loaded-elf", "name": "Elf", "traits": ["keen senses"]}
+    first = Race.from_dict(payload)
+    second = Race.from_dict(dict(payload))
+    assert first == second and first is not second
+
+    first.traits.append("darkvision")
+    assert second.traits == ["keen senses"]
+
+    class_payload = {"id": "class.loaded-scout", "name": "Scout", "hit_die": 8}
+    assert Class.from_dict(class_payload) is not Class.from_dict(dict(class_payload))
+
+
+def test_to_dict_keeps_state_fields_and_skips_derived_caches():
+    creature = Creature(
+        id="creature-saved",
+        name="Saved Beast",
+        level=2,
+        role="brute",
+        hit_die=8,
+        armor_class=12,
+        abilities={"strength": AbilityScore(name="strength", score=14)},
+        actions=[],
+    )
+    payload = creature.to_dict()
+
+    assert payload["_base_armor_class"] == 12
+    assert "_modifier_cache" not in payload and "_version" not in payload